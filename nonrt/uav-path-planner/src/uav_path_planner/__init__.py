@@ -4,6 +4,7 @@ from .planner import (
     RadioMap,
     PlannerConfig,
     plan_flight_path,
+    plan_flight_paths_batch,
     policy_to_dict,
     policy_from_dict,
 )
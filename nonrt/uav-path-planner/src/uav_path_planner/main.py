@@ -1,8 +1,9 @@
 """CLI demo for the Non-RT path planner."""
 
-import json
 from pathlib import Path
 
+import orjson
+
 from uav_policy.policy_engine import ServiceProfile
 from uav_path_planner.planner import (
     Waypoint,
@@ -53,16 +54,14 @@ def main() -> None:
     waypoints, radio_map, service, config = build_demo_inputs()
     policy = plan_flight_path(uav_id, waypoints, radio_map, service, config)
 
-    out = policy_to_dict(policy)
-    print(json.dumps(out, indent=2))
+    out = orjson.dumps(policy_to_dict(policy), option=orjson.OPT_INDENT_2)
+    print(out.decode("utf-8"))
 
     # Optionally write to sim artifacts location if present
     repo_root = Path(__file__).resolve().parents[3]
     artifacts_dir = repo_root / "sim" / "artifacts" / "policies"
     artifacts_dir.mkdir(parents=True, exist_ok=True)
-    (artifacts_dir / f"{uav_id}-demo.json").write_text(
-        json.dumps(out, indent=2), encoding="utf-8"
-    )
+    (artifacts_dir / f"{uav_id}-demo.json").write_bytes(out)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from uav_policy.policy_engine import (
     PathSegmentPlan,
@@ -9,8 +12,35 @@ from uav_policy.policy_engine import (
     ServiceProfile,
 )
 
+try:
+    from numba import njit, prange
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` when numba is not installed."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Fast-math flags for the DP kernel. "nnan"/"ninf" are left out on purpose:
+# non-candidate cells are masked with -inf and must compare correctly.
+_DP_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
 
-@dataclass
+# Explicit signatures make numba compile the kernels when the module is
+# imported (or load them from the on-disk cache) instead of on the first
+# planning call. Utilities are float32; ``ho_penalty`` is cast to float32.
+_DP_KERNEL_SIG = "Tuple((f4[:], i4[:, :]))(f4[:, :], f4)"
+_DP_BATCH_KERNEL_SIG = "Tuple((f4[:, :], i4[:, :, :]))(f4[:, :, :], i8[:], f4)"
+
+
+@dataclass(slots=True, frozen=True)
 class Waypoint:
     """Discretized waypoint along a UAV path."""
 
@@ -20,7 +50,7 @@ class Waypoint:
     z: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CellMetric:
     """Radio metric for a cell at a given waypoint."""
 
@@ -28,17 +58,145 @@ class CellMetric:
     load: float  # Expected PRB utilization [0, 1]
 
 
-@dataclass
-class RadioMap:
-    """Radio map indexed by waypoint index and cell id."""
+def _columns_equal(a: Optional[np.ndarray], b: Optional[np.ndarray]) -> bool:
+    """Whether two optional SoA columns hold the same values (NaN == NaN)."""
+    if a is None or b is None:
+        return a is b
+    return bool(np.array_equal(a, b, equal_nan=True))
 
-    metrics: Dict[int, Dict[str, CellMetric]]
 
-    def get_cells_for_step(self, step: int) -> Dict[str, CellMetric]:
-        return self.metrics.get(step, {})
+@dataclass(slots=True, frozen=True, eq=False)
+class RadioMap:
+    """Radio map indexed by waypoint index and cell id.
+
+    Backed either by the nested ``metrics`` dict or, when built with
+    `from_arrays`/`from_legacy`, by dense SoA columns: ``sinr`` and ``load``
+    are ``(len(steps), len(cell_ids))`` float32 matrices with NaN where a
+    cell has no metric at a step. Maps compare by value (NaN entries are
+    equal) and, like the ``metrics`` dict, are unhashable.
+    """
+
+    metrics: Dict[int, Dict[str, CellMetric]] = field(default_factory=dict)
+    steps: Tuple[int, ...] = ()
+    cell_ids: Tuple[str, ...] = ()
+    sinr: Optional[np.ndarray] = field(default=None, repr=False)
+    load: Optional[np.ndarray] = field(default=None, repr=False)
+    _rows: Dict[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned cell ids make the downstream cell-id compares and lookups
+        # pointer comparisons in the common case.
+        if self.metrics:
+            metrics = {
+                step: {sys.intern(cell_id): met for cell_id, met in cells.items()}
+                for step, cells in self.metrics.items()
+            }
+            object.__setattr__(self, "metrics", metrics)
+        object.__setattr__(self, "cell_ids", tuple(sys.intern(c) for c in self.cell_ids))
+        object.__setattr__(self, "_rows", {step: i for i, step in enumerate(self.steps)})
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RadioMap):
+            return NotImplemented
+        return (
+            self.metrics == other.metrics
+            and self.steps == other.steps
+            and self.cell_ids == other.cell_ids
+            and _columns_equal(self.sinr, other.sinr)
+            and _columns_equal(self.load, other.load)
+        )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        steps: Sequence[int],
+        cell_ids: Sequence[str],
+        sinr: np.ndarray,
+        load: np.ndarray,
+    ) -> "RadioMap":
+        """Build a SoA-backed map from per-step SINR/load matrices."""
+        sinr = np.asarray(sinr, dtype=np.float32)
+        load = np.asarray(load, dtype=np.float32)
+        shape = (len(steps), len(cell_ids))
+        if sinr.shape != shape or load.shape != shape:
+            raise ValueError(f"sinr and load must have shape {shape}.")
+        return cls(
+            steps=tuple(int(s) for s in steps),
+            cell_ids=tuple(cell_ids),
+            sinr=sinr,
+            load=load,
+        )
+
+    @classmethod
+    def from_legacy(cls, metrics: Dict[int, Dict[str, CellMetric]]) -> "RadioMap":
+        """Convert a nested ``{step: {cell_id: CellMetric}}`` dict to SoA columns."""
+        steps = sorted(metrics)
+        cell_ids, sinr, load, _ = cls(metrics=metrics).to_arrays(steps)
+        return cls.from_arrays(steps, cell_ids, sinr, load)
 
-@dataclass
+    def get_cells_for_step(self, step: int) -> Dict[str, CellMetric]:
+        if self.sinr is None:
+            return self.metrics.get(step, {})
+        row = self._rows.get(step)
+        if row is None:
+            return {}
+        sinr, load = self.sinr[row].tolist(), self.load[row].tolist()
+        return {
+            cell_id: CellMetric(sinr_db=sinr[j], load=load[j])
+            for j, cell_id in enumerate(self.cell_ids)
+            if sinr[j] == sinr[j]  # NaN = no metric
+        }
+
+    def to_soa(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """``(sinr, load, mask, cell_ids)`` over every step of the map.
+
+        Rows follow ``steps`` for SoA-backed maps and ascending waypoint
+        index for dict-backed ones.
+        """
+        if self.sinr is None:
+            cell_ids, sinr, load, valid = self.to_arrays(sorted(self.metrics))
+            return sinr, load, valid, cell_ids
+        return self.sinr, self.load, ~np.isnan(self.sinr), list(self.cell_ids)
+
+    def to_arrays(
+        self, steps: Sequence[int]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Dense ``(len(steps), n_cells)`` SINR/load matrices for the given steps.
+
+        Returns ``(cell_ids, sinr, load, valid)``. Columns follow ``cell_ids``
+        for SoA-backed maps and the order in which cells are first seen
+        otherwise; cells without a metric at a step are NaN in
+        ``sinr``/``load`` and False in ``valid``.
+        """
+        if self.sinr is not None:
+            rows = np.array([self._rows.get(step, -1) for step in steps], dtype=np.intp)
+            present = rows >= 0
+            shape = (len(steps), len(self.cell_ids))
+            sinr = np.full(shape, np.nan, dtype=np.float32)
+            load = np.full(shape, np.nan, dtype=np.float32)
+            sinr[present] = self.sinr[rows[present]]
+            load[present] = self.load[rows[present]]
+            return list(self.cell_ids), sinr, load, ~np.isnan(sinr)
+
+        cell_pos: Dict[str, int] = {}
+        for step in steps:
+            for cell_id in self.get_cells_for_step(step):
+                cell_pos.setdefault(cell_id, len(cell_pos))
+
+        shape = (len(steps), len(cell_pos))
+        sinr = np.full(shape, np.nan, dtype=np.float32)
+        load = np.full(shape, np.nan, dtype=np.float32)
+        for i, step in enumerate(steps):
+            for cell_id, met in self.get_cells_for_step(step).items():
+                j = cell_pos[cell_id]
+                sinr[i, j] = met.sinr_db
+                load[i, j] = met.load
+
+        valid = ~np.isnan(sinr)
+        return list(cell_pos), sinr, load, valid
+
+
+@dataclass(slots=True, frozen=True)
 class PlannerConfig:
     """Configuration and utility parameters for the DP planner."""
 
@@ -48,144 +206,215 @@ class PlannerConfig:
     ho_penalty: float = 0.5
 
     def utility(self, sinr_db: float, load: float) -> float:
-        """Higher is better. Encourages SINR above threshold, discourages load."""
+        """Higher is better. Encourages SINR above threshold, discourages load.
+
+        Also works elementwise on NumPy arrays of SINR and load.
+        """
         sinr_margin = sinr_db - self.sinr_min_db
         return self.w_sinr * sinr_margin - self.w_load * load
 
 
-def _choose_cells_dp(
+@njit(_DP_KERNEL_SIG, cache=True, fastmath=_DP_FASTMATH)
+def _dp_kernel(util, ho_penalty):
+    """Viterbi over a ``(steps, cells)`` utility matrix (-inf = not a candidate).
+
+    The handover penalty is the same for every cell change, so the best
+    predecessor of cell j is either j itself or the best other cell, i.e.
+    the top-1 previous score (or the top-2 when top-1 is j). That keeps each
+    step O(cells) instead of O(cells^2).
+
+    Returns the score vector at the last step and the int32 backpointers.
+    """
+    n_steps, n_cells = util.shape
+    # Only the previous and current score columns are kept; the backpointers
+    # are the sole O(steps * cells) state. Row 0 is never read by backtrack.
+    back = np.empty((n_steps, n_cells), dtype=np.int32)
+    back[0] = 0
+    prev = util[0].copy()
+    curr = np.empty_like(prev)
+    for t in range(1, n_steps):
+        top1 = -np.inf
+        top2 = -np.inf
+        top1_i = 0
+        top2_i = 0
+        for i in range(n_cells):
+            v = prev[i]
+            if v > top1:
+                top2 = top1
+                top2_i = top1_i
+                top1 = v
+                top1_i = i
+            elif v > top2:
+                top2 = v
+                top2_i = i
+
+        for j in range(n_cells):
+            if j != top1_i:
+                ho_best = top1 - ho_penalty
+                ho_i = top1_i
+            else:
+                ho_best = top2 - ho_penalty
+                ho_i = top2_i
+            if prev[j] >= ho_best:
+                curr[j] = util[t, j] + prev[j]
+                back[t, j] = j
+            else:
+                curr[j] = util[t, j] + ho_best
+                back[t, j] = ho_i
+        prev, curr = curr, prev
+    return prev, back
+
+
+def _dp_broadcast(util: np.ndarray, ho_penalty: float) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy equivalent of `_dp_kernel`, used when numba is not available."""
+    n_steps, n_cells = util.shape
+    cells = np.arange(n_cells, dtype=np.int32)
+    back = np.zeros((n_steps, n_cells), dtype=np.int32)
+    score = util[0]
+    for t in range(1, n_steps):
+        top1_i = int(score.argmax())
+        rest = score.copy()
+        rest[top1_i] = -np.inf
+        top2_i = int(rest.argmax())
+
+        ho_i = np.full(n_cells, top1_i, dtype=np.int32)
+        ho_i[top1_i] = top2_i
+        ho_best = np.full(n_cells, score[top1_i] - ho_penalty, dtype=score.dtype)
+        ho_best[top1_i] = rest[top2_i] - ho_penalty
+
+        stay = score >= ho_best
+        back[t] = np.where(stay, cells, ho_i)
+        score = util[t] + np.where(stay, score, ho_best)
+    return score, back
+
+
+@njit(_DP_BATCH_KERNEL_SIG, parallel=True, cache=True, fastmath=_DP_FASTMATH)
+def _dp_batch_kernel(util, lengths, ho_penalty):
+    """Run `_dp_kernel` per UAV over a padded ``(uavs, steps, cells)`` tensor.
+
+    UAV ``u`` uses the first ``lengths[u]`` steps; flights are independent,
+    so the outer loop is a ``prange``.
+    """
+    n_uavs, n_steps, n_cells = util.shape
+    scores = np.empty((n_uavs, n_cells), dtype=util.dtype)
+    back = np.zeros((n_uavs, n_steps, n_cells), dtype=np.int32)
+    for u in prange(n_uavs):
+        score, b = _dp_kernel(util[u, : lengths[u]], ho_penalty)
+        scores[u] = score
+        back[u, : lengths[u]] = b
+    return scores, back
+
+
+def _utility_matrix(
     waypoints: List[Waypoint],
     radio_map: RadioMap,
     config: PlannerConfig,
-) -> List[str]:
-    """Dynamic programming over waypoints to choose a serving cell per step."""
-    if not waypoints:
-        return []
-
-    # Ensure waypoints are sorted by index
-    waypoints = sorted(waypoints, key=lambda w: w.index)
+) -> Tuple[List[str], np.ndarray]:
+    """Build the ``(steps, cells)`` DP utility matrix (-inf = not a candidate)."""
     steps = [w.index for w in waypoints]
-    step_to_pos = {w.index: i for i, w in enumerate(waypoints)}
-    n_steps = len(steps)
+    cell_ids, sinr, load, valid = radio_map.to_arrays(steps)
 
-    # dp_states[step_idx][cell_id] = (score, prev_cell_id)
-    dp_states: List[Dict[str, Tuple[float, Optional[str]]]] = []
-
-    # Initialize at first step
-    first_step = steps[0]
-    first_cells = radio_map.get_cells_for_step(first_step)
-    if not first_cells:
+    empty = ~valid.any(axis=1)
+    if empty[0]:
         raise ValueError("RadioMap has no metrics for first waypoint.")
+    if empty.any():
+        step = steps[int(empty.argmax())]
+        raise ValueError(f"RadioMap has no metrics for waypoint index={step}.")
+
+    # Candidate cells meet the SINR threshold; where none does, fall back to
+    # the cell with the highest SINR at that step.
+    candidates = valid & (sinr >= config.sinr_min_db)
+    fallback = np.flatnonzero(~candidates.any(axis=1))
+    if fallback.size:
+        best = np.where(valid[fallback], sinr[fallback], -np.inf).argmax(axis=1)
+        candidates[fallback, best] = True
+
+    # One elementwise utility evaluation per (step, cell), reused by the DP.
+    util = config.utility(sinr, load)
+    return cell_ids, np.where(candidates, util, -np.inf).astype(np.float32)
+
+
+def _backtrack(score: np.ndarray, back: np.ndarray) -> np.ndarray:
+    """int32 cell index per step from the last-step scores and backpointers."""
+    n_steps = back.shape[0]
+    idx = np.empty(n_steps, dtype=np.int32)
+    idx[-1] = score.argmax()
+    for t in range(n_steps - 1, 0, -1):
+        idx[t - 1] = back[t, idx[t]]
+    return idx
+
+
+def _choose_cell_indices(
+    waypoints: List[Waypoint],
+    radio_map: RadioMap,
+    config: PlannerConfig,
+) -> Tuple[List[str], np.ndarray]:
+    """Dynamic programming over waypoints to choose a serving cell per step.
+
+    ``waypoints`` must already be sorted by index. Returns the column cell
+    ids and the chosen int32 column index per waypoint.
+    """
+    if not waypoints:
+        return [], np.empty(0, dtype=np.int32)
+
+    cell_ids, util = _utility_matrix(waypoints, radio_map, config)
+    dp = _dp_kernel if _HAVE_NUMBA else _dp_broadcast
+    score, back = dp(util, config.ho_penalty)
+    idx = _backtrack(score, back)
+    if __debug__:
+        # Every step has a candidate, so the best path never lands on a
+        # masked (-inf) cell. Checked once per path; stripped by ``python -O``.
+        chosen = util[np.arange(idx.size), idx]
+        if not np.isfinite(chosen).all():
+            raise AssertionError("DP path selected a non-candidate cell.")
+    return cell_ids, idx
 
-    # Candidate cells for first step
-    candidates_first: Dict[str, CellMetric] = {}
-    for cell_id, met in first_cells.items():
-        if met.sinr_db >= config.sinr_min_db:
-            candidates_first[cell_id] = met
-    if not candidates_first:
-        # Fallback: choose cell with highest SINR
-        best_cell = max(first_cells.items(), key=lambda kv: kv[1].sinr_db)[0]
-        candidates_first[best_cell] = first_cells[best_cell]
-
-    dp0: Dict[str, Tuple[float, Optional[str]]] = {}
-    for cell_id, met in candidates_first.items():
-        score = config.utility(met.sinr_db, met.load)
-        dp0[cell_id] = (score, None)
-    dp_states.append(dp0)
-
-    # Iterate over remaining steps
-    for i in range(1, n_steps):
-        step = steps[i]
-        cell_metrics = radio_map.get_cells_for_step(step)
-        if not cell_metrics:
-            raise ValueError(f"RadioMap has no metrics for waypoint index={step}.")
-
-        candidates: Dict[str, CellMetric] = {}
-        for cell_id, met in cell_metrics.items():
-            if met.sinr_db >= config.sinr_min_db:
-                candidates[cell_id] = met
-        if not candidates:
-            # Fallback: pick cell with highest SINR
-            best_cell = max(cell_metrics.items(), key=lambda kv: kv[1].sinr_db)[0]
-            candidates[best_cell] = cell_metrics[best_cell]
-
-        prev_dp = dp_states[-1]
-        curr_dp: Dict[str, Tuple[float, Optional[str]]] = {}
-
-        for cell_id, met in candidates.items():
-            best_score: Optional[float] = None
-            best_prev_cell: Optional[str] = None
-            for prev_cell, (prev_score, _) in prev_dp.items():
-                score = prev_score + config.utility(met.sinr_db, met.load)
-                if prev_cell != cell_id:
-                    score -= config.ho_penalty
-                if best_score is None or score > best_score:
-                    best_score = score
-                    best_prev_cell = prev_cell
-            assert best_score is not None
-            curr_dp[cell_id] = (best_score, best_prev_cell)
-
-        dp_states.append(curr_dp)
-
-    # Backtrack
-    last_dp = dp_states[-1]
-    last_cell = max(last_dp.items(), key=lambda kv: kv[1][0])[0]
-
-    chosen_cells: List[str] = ["" for _ in range(n_steps)]
-    chosen_cells[-1] = last_cell
-    for i in range(n_steps - 1, 0, -1):
-        _, prev_cell = dp_states[i][chosen_cells[i]]
-        assert prev_cell is not None
-        chosen_cells[i - 1] = prev_cell
-
-    return chosen_cells
+
+def _choose_cells_dp(
+    waypoints: List[Waypoint],
+    radio_map: RadioMap,
+    config: PlannerConfig,
+) -> List[str]:
+    """Serving cell id per waypoint; ``waypoints`` must be sorted by index."""
+    cell_ids, idx = _choose_cell_indices(waypoints, radio_map, config)
+    return [cell_ids[j] for j in idx.tolist()]
 
 
 def _compress_to_segments(
     uav_id: str,
     waypoints: List[Waypoint],
-    cells: List[str],
+    cell_ids: Sequence[str],
+    cell_idx: np.ndarray,
     service: ServiceProfile,
 ) -> FlightPlanPolicy:
-    if not waypoints or not cells:
+    """Merge runs of the same cell into segments; ``waypoints`` sorted by index."""
+    if not waypoints or not len(cell_idx):
         return FlightPlanPolicy(uav_id=uav_id, segments=[])
 
-    waypoints = sorted(waypoints, key=lambda w: w.index)
     n = len(waypoints)
     norm = max(1, n - 1)
+    base_quota = max(5, int(service.target_bitrate_mbps))
 
-    segments: List[PathSegmentPlan] = []
-
-    current_cell = cells[0]
-    seg_start_idx = 0
+    # Runs start wherever the chosen cell index changes.
+    edges = (np.flatnonzero(np.diff(cell_idx)) + 1).tolist()
+    starts = [0, *edges]
+    ends = [e - 1 for e in edges] + [n - 1]
+    cells = cell_idx.tolist()
 
-    def add_segment(end_idx: int) -> None:
-        nonlocal seg_start_idx, current_cell, segments
-        start_wp = waypoints[seg_start_idx]
-        end_wp = waypoints[end_idx]
-
-        start_pos = start_wp.index / norm
-        end_pos = end_wp.index / norm
-        if end_idx == n - 1:
+    segments: List[PathSegmentPlan] = []
+    for start, end in zip(starts, ends):
+        end_pos = waypoints[end].index / norm
+        if end == n - 1:
             end_pos = min(1.0, end_pos + 1e-9)
-
-        base_quota = max(5, int(service.target_bitrate_mbps))
-        seg = PathSegmentPlan(
-            start_pos=start_pos,
-            end_pos=end_pos,
-            planned_cell_id=current_cell,
-            slice_id=service.name,
-            base_prb_quota=base_quota,
+        segments.append(
+            PathSegmentPlan(
+                start_pos=waypoints[start].index / norm,
+                end_pos=end_pos,
+                planned_cell_id=cell_ids[cells[start]],
+                slice_id=service.name,
+                base_prb_quota=base_quota,
+            )
         )
-        segments.append(seg)
-
-    for i in range(1, n):
-        if cells[i] != current_cell:
-            add_segment(i - 1)
-            current_cell = cells[i]
-            seg_start_idx = i
-
-    add_segment(n - 1)
     return FlightPlanPolicy(uav_id=uav_id, segments=segments)
 
 
@@ -200,8 +429,57 @@ def plan_flight_path(
     if config is None:
         config = PlannerConfig(sinr_min_db=service.min_sinr_db)
 
-    cells = _choose_cells_dp(waypoints, radio_map, config)
-    return _compress_to_segments(uav_id, waypoints, cells, service)
+    waypoints = sorted(waypoints, key=lambda w: w.index)
+    cell_ids, cell_idx = _choose_cell_indices(waypoints, radio_map, config)
+    return _compress_to_segments(uav_id, waypoints, cell_ids, cell_idx, service)
+
+
+def plan_flight_paths_batch(
+    uav_ids: Sequence[str],
+    waypoints: Sequence[List[Waypoint]],
+    radio_maps: Sequence[RadioMap],
+    service: ServiceProfile,
+    config: Optional[PlannerConfig] = None,
+) -> List[FlightPlanPolicy]:
+    """Plan several UAVs at once; same result as `plan_flight_path` per UAV.
+
+    The per-UAV utility matrices are padded into one ``(uavs, steps, cells)``
+    tensor and solved by `_dp_batch_kernel`, which spreads UAVs across
+    threads when numba is installed.
+    """
+    if config is None:
+        config = PlannerConfig(sinr_min_db=service.min_sinr_db)
+
+    sorted_wps = [sorted(wps, key=lambda w: w.index) for wps in waypoints]
+    active = [u for u, wps in enumerate(sorted_wps) if wps]
+    mats = [_utility_matrix(sorted_wps[u], radio_maps[u], config) for u in active]
+
+    chosen: List[Tuple[List[str], np.ndarray]] = [
+        ([], np.empty(0, dtype=np.int32)) for _ in uav_ids
+    ]
+    if mats:
+        lengths = np.array([util.shape[0] for _, util in mats], dtype=np.int64)
+        n_cells = max(util.shape[1] for _, util in mats)
+        util_t = np.full((len(mats), int(lengths.max()), n_cells), -np.inf, dtype=np.float32)
+        for k, (_, util) in enumerate(mats):
+            util_t[k, : util.shape[0], : util.shape[1]] = util
+
+        if _HAVE_NUMBA:
+            scores, back = _dp_batch_kernel(util_t, lengths, config.ho_penalty)
+        else:
+            scores = np.empty((len(mats), n_cells), dtype=np.float32)
+            back = np.zeros(util_t.shape, dtype=np.int32)
+            for k in range(len(mats)):
+                n = lengths[k]
+                scores[k], back[k, :n] = _dp_broadcast(util_t[k, :n], config.ho_penalty)
+
+        for k, u in enumerate(active):
+            chosen[u] = (mats[k][0], _backtrack(scores[k], back[k, : lengths[k]]))
+
+    return [
+        _compress_to_segments(uav_id, wps, cell_ids, cell_idx, service)
+        for uav_id, wps, (cell_ids, cell_idx) in zip(uav_ids, sorted_wps, chosen)
+    ]
 
 
 def policy_to_dict(policy: FlightPlanPolicy) -> dict:
@@ -1,3 +1,5 @@
+import pytest
+
 from uav_policy.policy_engine import ServiceProfile
 from uav_path_planner.planner import (
     Waypoint,
@@ -5,6 +7,7 @@ from uav_path_planner.planner import (
     RadioMap,
     PlannerConfig,
     plan_flight_path,
+    plan_flight_paths_batch,
 )
 
 
@@ -30,3 +33,88 @@ def test_plan_flight_path_produces_segments():
     seg = policy.segments[0]
     assert 0.0 <= seg.start_pos <= seg.end_pos <= 1.0
     assert seg.base_prb_quota >= 5
+
+
+def test_plan_flight_path_hands_over_to_stronger_cell():
+    waypoints = [Waypoint(index=i, x=50.0 * i, y=0.0, z=50.0) for i in range(4)]
+
+    def cells(sinr_a, sinr_b, load_a=0.2, load_b=0.2):
+        return {
+            "cell-A": CellMetric(sinr_db=sinr_a, load=load_a),
+            "cell-B": CellMetric(sinr_db=sinr_b, load=load_b),
+        }
+
+    metrics = {
+        0: cells(5.0, -8.0),
+        1: cells(3.0, -1.0),
+        2: cells(-8.0, 4.0),
+        # No cell meets the threshold: fall back to the highest-SINR cell.
+        3: cells(-9.0, -6.0, load_a=0.1, load_b=0.9),
+    }
+
+    radio_map = RadioMap(metrics=metrics)
+    service = ServiceProfile(name="uav-hd-video", target_bitrate_mbps=8.0, min_sinr_db=-5.0)
+
+    policy = plan_flight_path("uav-001", waypoints, radio_map, service)
+    assert [seg.planned_cell_id for seg in policy.segments] == ["cell-A", "cell-B"]
+    assert policy.segments[0].end_pos < policy.segments[1].start_pos <= policy.segments[1].end_pos
+
+
+def test_plan_flight_paths_batch_matches_single_uav_planning():
+    service = ServiceProfile(name="uav-hd-video", target_bitrate_mbps=8.0, min_sinr_db=-3.0)
+    flights = {
+        "uav-001": (3, {"cell-A": 2.0, "cell-B": -1.0}),
+        "uav-002": (5, {"cell-B": 1.0, "cell-C": 4.0}),
+    }
+
+    uav_ids, waypoints, radio_maps = [], [], []
+    for uav_id, (n_steps, sinr) in flights.items():
+        uav_ids.append(uav_id)
+        waypoints.append([Waypoint(index=i, x=10.0 * i, y=0.0, z=50.0) for i in range(n_steps)])
+        radio_maps.append(
+            RadioMap(
+                metrics={
+                    i: {cell: CellMetric(sinr_db=s - i, load=0.3) for cell, s in sinr.items()}
+                    for i in range(n_steps)
+                }
+            )
+        )
+
+    batch = plan_flight_paths_batch(uav_ids, waypoints, radio_maps, service)
+    single = [
+        plan_flight_path(uav_id, wps, rmap, service)
+        for uav_id, wps, rmap in zip(uav_ids, waypoints, radio_maps)
+    ]
+    assert batch == single
+    assert [p.uav_id for p in batch] == uav_ids
+
+
+def test_soa_radio_map_plans_like_dict_radio_map():
+    metrics = {
+        i: {
+            "cell-A": CellMetric(sinr_db=4.0 - 2.0 * i, load=0.4),
+            "cell-B": CellMetric(sinr_db=-2.0 + 2.0 * i, load=0.2),
+        }
+        for i in range(5)
+    }
+    del metrics[4]["cell-A"]
+    waypoints = [Waypoint(index=i, x=25.0 * i, y=0.0, z=50.0) for i in range(5)]
+    service = ServiceProfile(name="uav-hd-video", target_bitrate_mbps=8.0, min_sinr_db=-3.0)
+
+    dict_map = RadioMap(metrics=metrics)
+    soa_map = RadioMap.from_legacy(metrics)
+    sinr, load, mask, cell_ids = soa_map.to_soa()
+    assert cell_ids == ["cell-A", "cell-B"]
+    assert sinr.shape == load.shape == mask.shape == (5, 2)
+    assert not mask[4, 0]
+    assert set(soa_map.get_cells_for_step(4)) == {"cell-B"}
+
+    assert plan_flight_path("uav-001", waypoints, soa_map, service) == plan_flight_path(
+        "uav-001", waypoints, dict_map, service
+    )
+
+    # Equality compares the SoA columns (NaN gaps included); maps are unhashable
+    assert soa_map == RadioMap.from_legacy(metrics)
+    assert soa_map != RadioMap.from_arrays(soa_map.steps, soa_map.cell_ids, sinr + 1.0, load)
+    with pytest.raises(TypeError):
+        hash(soa_map)
@@ -13,12 +13,17 @@ from pathlib import Path
 
 import yaml  # type: ignore
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed parser
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def main() -> None:
     scenario_path = REPO_ROOT / "sim" / "nsoran" / "scenario.yaml"
-    data = yaml.safe_load(scenario_path.read_text(encoding="utf-8"))
+    data = yaml.load(scenario_path.read_text(encoding="utf-8"), Loader=SafeLoader)
     scenario_id = data.get("scenario_id")
     description = data.get("description")
     print(f"[sim-glue] Scenario: {scenario_id}")
@@ -1 +0,0 @@
-"""RC gRPC client package."""
\ No newline at end of file
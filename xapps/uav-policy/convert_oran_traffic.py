@@ -10,9 +10,11 @@ import json
 import csv
 import argparse
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import logging
 
+import orjson
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -23,22 +25,25 @@ class TrafficConverter:
     def __init__(self, input_file: str):
         self.input_file = Path(input_file)
         self.traffic_data = []
+        self._stream_csv = False
 
     def load_traffic(self) -> bool:
         """Load traffic data from TRACTOR dataset"""
         try:
             if self.input_file.suffix == '.json':
-                with open(self.input_file) as f:
-                    self.traffic_data = json.load(f)
+                with open(self.input_file, 'rb') as f:
+                    self.traffic_data = orjson.loads(f.read())
+                logger.info(f"Loaded {len(self.traffic_data)} traffic records")
             elif self.input_file.suffix == '.csv':
+                # CSV rows are streamed on conversion; only the header is read here
                 with open(self.input_file) as f:
-                    reader = csv.DictReader(f)
-                    self.traffic_data = list(reader)
+                    next(csv.reader(f), None)
+                self._stream_csv = True
+                logger.info(f"Streaming CSV traffic records from {self.input_file}")
             else:
                 logger.error(f"Unsupported format: {self.input_file.suffix}")
                 return False
 
-            logger.info(f"Loaded {len(self.traffic_data)} traffic records")
             return True
         except Exception as e:
             logger.error(f"Failed to load traffic: {e}")
@@ -103,11 +108,23 @@ class TrafficConverter:
 
         return indication
 
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield loaded traffic records (CSV rows are read lazily)"""
+        if self._stream_csv:
+            with open(self.input_file) as f:
+                yield from csv.DictReader(f)
+        else:
+            yield from self.traffic_data
+
+    def iter_converted(self) -> Iterator[Dict[str, Any]]:
+        """Convert records one at a time"""
+        for record in self.iter_records():
+            yield self.convert_to_ns3_indication(record)
+
     def convert_all(self) -> List[Dict[str, Any]]:
         """Convert all records"""
         logger.info("Converting traffic records...")
-        converted = [self.convert_to_ns3_indication(record)
-                    for record in self.traffic_data]
+        converted = list(self.iter_converted())
         logger.info(f"Converted {len(converted)} records")
         return converted
 
@@ -119,11 +136,10 @@ class TrafficConverter:
         logger.info(f"Saved to {output_file}")
 
     def save_as_jsonl(self, output_file: str):
-        """Save converted traffic as JSONL (one JSON per line)"""
-        converted = self.convert_all()
-        with open(output_file, 'w') as f:
-            for record in converted:
-                f.write(json.dumps(record) + '\n')
+        """Save converted traffic as JSONL (one JSON per line), streaming records"""
+        with open(output_file, 'wb') as f:
+            f.writelines(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+                         for record in self.iter_converted())
         logger.info(f"Saved to {output_file} (JSONL format)")
 
 
@@ -6,17 +6,98 @@ Generates synthetic 5G traffic data compatible with the TRACTOR dataset format
 for testing UAV Policy xApp without needing to download the full dataset.
 """
 
-import csv
 import json
 import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 import argparse
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Output precision of the fixed-point CSV fields (applied at write time)
+CSV_FLOAT_FORMATS = {
+    "rsrp_serving_dbm": "%.1f",
+    "sinr_db": "%.1f",
+    "prb_utilization": "%.2f",
+    "throughput_mbps": "%.2f",
+    "latency_ms": "%.2f",
+    "dl_bitrate_mbps": "%.2f",
+    "ul_bitrate_mbps": "%.2f",
+}
+
+# Physical bounds of the generated metrics
+_RSRP_LO, _RSRP_HI = -140.0, -40.0  # dBm
+_PRB_LO, _PRB_HI = 0.0, 1.0
+_PACKET_LOSS_LO, _PACKET_LOSS_HI = 0.0, 0.1
+
+
+def _ue_metric_columns(ue_id: int, imsi: str, ue_type: str, num_samples: int,
+                       rng: np.random.Generator) -> dict:
+    """Generate metrics for a single UE as columns (one array per field)"""
+    n = num_samples
+    t = np.arange(n)
+
+    # Simulate mobility and changing radio conditions
+    rsrp_baseline = -85.0 if ue_type == "eMBB" else -80.0
+    prb_util_baseline = 0.6 if ue_type == "eMBB" else 0.3
+
+    # Noise is drawn in bulk, one call per source
+    fast_fading = rng.normal(0, 2, n)
+    prb_noise = rng.normal(0, 0.05, n)
+    sinr_noise = rng.normal(0, 1, n)
+    latency_noise = rng.exponential(2, n)
+
+    # Simulate RSRP variation (slow fading + fast fading)
+    slow_fading = np.sin(t / 100) * 5
+    rsrp = rsrp_baseline + slow_fading + fast_fading
+    np.clip(rsrp, _RSRP_LO, _RSRP_HI, out=rsrp)
+
+    # Simulate PRB utilization (based on traffic)
+    traffic_pattern = 0.5 + 0.3 * np.sin(t / 50)
+    prb_util = prb_util_baseline + traffic_pattern + prb_noise
+    np.clip(prb_util, _PRB_LO, _PRB_HI, out=prb_util)
+
+    # SINR estimation (roughly RSRP + 100)
+    sinr = rsrp + 100 + sinr_noise
+
+    # Throughput estimation (depends on SINR and PRB allocation)
+    # Shannon capacity: C = BW * log2(1 + SINR)
+    # With 10 MHz = 50 PRBs, each PRB ≈ 180 kHz
+    prb_count = (50 * prb_util).astype(np.int64)
+    bw_mhz = (prb_count / 50) * 10
+    snr_linear = 10 ** (sinr / 10)
+    throughput_mbps = np.maximum(0, bw_mhz * np.log2(1 + snr_linear))
+
+    # Latency (depends on queue depth)
+    queue_depth = (prb_util * 100).astype(np.int64)
+    latency_ms = 10 + queue_depth / 10 + latency_noise
+
+    return {
+        "timestamp": t,
+        "ue_imsi": np.full(n, imsi),
+        "ue_id": np.full(n, ue_id),
+        "traffic_type": np.full(n, ue_type),
+        "rsrp_serving_dbm": rsrp,
+        "sinr_db": sinr,
+        "prb_utilization": prb_util,
+        "prb_allocation": prb_count,
+        "throughput_mbps": throughput_mbps,
+        "latency_ms": latency_ms,
+        "packet_loss_rate": np.clip(prb_util - 0.8, _PACKET_LOSS_LO, _PACKET_LOSS_HI) * 100,
+        "handover_count": t // 500  # One handover every 500 samples
+    }
+
+
+def _generate_and_write(ue_id: int, rng: np.random.Generator, path: Path, imsi: str,
+                        ue_type: str, num_samples: int) -> None:
+    """Worker: generate one UE's metrics and write its CSV in the same process"""
+    columns = _ue_metric_columns(ue_id, imsi, ue_type, num_samples, rng)
+    SyntheticTractorGenerator._write_csv(path, columns)
+
 
 class SyntheticTractorGenerator:
     """Generate synthetic TRACTOR-compatible metrics"""
@@ -31,7 +112,10 @@ class SyntheticTractorGenerator:
         """
         self.num_ues = num_ues
         self.num_samples = num_samples
-        np.random.seed(seed)
+        self._rng = np.random.default_rng(seed)
+        # Independent per-UE streams: a UE's samples don't depend on the
+        # order (or process) in which UEs are generated
+        self._ue_rngs = self._rng.spawn(num_ues)
 
         # TRACTOR UE configuration
         self.ue_imsis = [
@@ -43,117 +127,87 @@ class SyntheticTractorGenerator:
             ["eMBB"] * 4 + ["URLLC"] * 4
         )[:num_ues]
 
-    def generate_ue_metrics(self, ue_id: int) -> list:
-        """Generate metrics for a single UE"""
-        ue_type = self.ue_types[ue_id - 1]
-        metrics = []
-
-        # Simulate mobility and changing radio conditions
-        rsrp_baseline = -85.0 if ue_type == "eMBB" else -80.0
-        prb_util_baseline = 0.6 if ue_type == "eMBB" else 0.3
-
-        for t in range(self.num_samples):
-            # Simulate RSRP variation (slow fading + fast fading)
-            slow_fading = np.sin(t / 100) * 5  # Slow variation
-            fast_fading = np.random.normal(0, 2)  # Fast fading
-            rsrp = rsrp_baseline + slow_fading + fast_fading
-            rsrp = np.clip(rsrp, -140, -40)
-
-            # Simulate PRB utilization (based on traffic)
-            traffic_pattern = 0.5 + 0.3 * np.sin(t / 50)
-            prb_util = prb_util_baseline + traffic_pattern + np.random.normal(0, 0.05)
-            prb_util = np.clip(prb_util, 0.0, 1.0)
-
-            # SINR estimation (roughly RSRP + 100)
-            sinr = rsrp + 100 + np.random.normal(0, 1)
-
-            # Throughput estimation (depends on SINR and PRB allocation)
-            # Shannon capacity: C = BW * log2(1 + SINR)
-            # With 10 MHz = 50 PRBs, each PRB ≈ 180 kHz
-            prb_count = int(50 * prb_util)
-            bw_mhz = (prb_count / 50) * 10
-            snr_linear = 10 ** (sinr / 10)
-            throughput_mbps = max(0, bw_mhz * np.log2(1 + snr_linear))
-
-            # Latency (depends on queue depth)
-            queue_depth = int(prb_util * 100)
-            latency_ms = 10 + queue_depth / 10 + np.random.exponential(2)
-
-            metrics.append({
-                "timestamp": t,
-                "ue_imsi": self.ue_imsis[ue_id - 1],
-                "ue_id": ue_id,
-                "traffic_type": ue_type,
-                "rsrp_serving_dbm": float(f"{rsrp:.1f}"),
-                "sinr_db": float(f"{sinr:.1f}"),
-                "prb_utilization": float(f"{prb_util:.2f}"),
-                "prb_allocation": prb_count,
-                "throughput_mbps": float(f"{throughput_mbps:.2f}"),
-                "latency_ms": float(f"{latency_ms:.2f}"),
-                "packet_loss_rate": max(0, min(0.1, prb_util - 0.8)) * 100,
-                "handover_count": int(t / 500)  # One handover every 500 samples
-            })
-
-        return metrics
-
-    def generate_enb_metrics(self) -> list:
-        """Generate base station metrics (aggregated)"""
-        metrics = []
-
-        for t in range(self.num_samples):
-            # Aggregate metrics across all UEs
-            total_dl_bitrate = 0
-            total_ul_bitrate = 0
-
-            for ue_id in range(1, self.num_ues + 1):
-                # Simulate per-UE throughput
-                ue_type = self.ue_types[ue_id - 1]
-                base_rate = 50 if ue_type == "eMBB" else 10  # Mbps
-                variation = base_rate * 0.3 * np.sin(t / 100)
-                dl_rate = base_rate + variation + np.random.normal(0, 5)
-                ul_rate = dl_rate * 0.3  # Asymmetric UL/DL
-
-                total_dl_bitrate += max(0, dl_rate)
-                total_ul_bitrate += max(0, ul_rate)
-
-            metrics.append({
-                "timestamp": t,
-                "dl_bitrate_mbps": float(f"{total_dl_bitrate:.2f}"),
-                "ul_bitrate_mbps": float(f"{total_ul_bitrate:.2f}"),
-                "total_prb_allocation": int(50 * (0.5 + 0.2 * np.sin(t / 50))),
-                "slice_0_allocation": int(30),  # eMBB
-                "slice_1_allocation": int(20),  # URLLC
-            })
-
-        return metrics
-
-    def save_as_csv(self, output_dir: str):
-        """Save metrics as CSV files (TRACTOR format)"""
+    def generate_ue_metrics(self, ue_id: int) -> dict:
+        """Generate metrics for a single UE as columns (one array per field)"""
+        return _ue_metric_columns(ue_id, self.ue_imsis[ue_id - 1], self.ue_types[ue_id - 1],
+                                  self.num_samples, self._ue_rngs[ue_id - 1])
+
+    def generate_enb_metrics(self) -> dict:
+        """Generate base station metrics (aggregated) as columns"""
+        n = self.num_samples
+        t = np.arange(n)
+
+        # Aggregate metrics across all UEs: one (samples, UEs) rate matrix
+        base_rate = np.array([50 if ue_type == "eMBB" else 10  # Mbps
+                              for ue_type in self.ue_types[:self.num_ues]])
+        variation = base_rate * 0.3 * np.sin(t / 100)[:, None]
+        dl_rate = base_rate + variation + self._rng.normal(0, 5, (n, len(base_rate)))
+        ul_rate = dl_rate * 0.3  # Asymmetric UL/DL
+
+        total_dl_bitrate = np.maximum(0, dl_rate).sum(axis=1)
+        total_ul_bitrate = np.maximum(0, ul_rate).sum(axis=1)
+
+        return {
+            "timestamp": t,
+            "dl_bitrate_mbps": total_dl_bitrate,
+            "ul_bitrate_mbps": total_ul_bitrate,
+            "total_prb_allocation": (50 * (0.5 + 0.2 * np.sin(t / 50))).astype(np.int64),
+            "slice_0_allocation": np.full(n, 30),  # eMBB
+            "slice_1_allocation": np.full(n, 20),  # URLLC
+        }
+
+    @staticmethod
+    def _render_csv(columns: dict) -> bytes:
+        """Render column arrays as CSV bytes, header first, rows zipped from the columns
+
+        Each row is formatted by one %-template built from CSV_FLOAT_FORMATS
+        (fixed-precision fields) and %s (everything else), in csv.writer's
+        dialect. No generated field needs quoting, so the csv module is
+        bypassed.
+        """
+        row_fmt = ",".join(CSV_FLOAT_FORMATS.get(name, "%s") for name in columns) + "\r\n"
+        rows = zip(*(col.tolist() for col in columns.values()))
+        return (",".join(columns) + "\r\n" + "".join([row_fmt % row for row in rows])).encode()
+
+    @staticmethod
+    def _write_csv(csv_file: Path, columns: dict):
+        """Write column arrays as CSV; the whole file goes out in one write"""
+        csv_file.write_bytes(SyntheticTractorGenerator._render_csv(columns))
+
+    def save_as_csv(self, output_dir: str, workers: Optional[int] = None):
+        """Save metrics as CSV files (TRACTOR format)
+
+        workers: Processes for per-UE generation (None = one per CPU,
+        1 = generate in this process)
+        """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Generate and save UE metrics
+        # Generate and save UE metrics; UEs are independent (own RNG stream,
+        # own file), so each worker writes its CSV and returns nothing
         logger.info(f"Generating metrics for {self.num_ues} UEs...")
-        for ue_id in range(1, self.num_ues + 1):
-            metrics = self.generate_ue_metrics(ue_id)
-            csv_file = output_path / f"{self.ue_imsis[ue_id - 1]}_metrics.csv"
-
-            with open(csv_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=metrics[0].keys())
-                writer.writeheader()
-                writer.writerows(metrics)
-
+        ue_ids = range(1, self.num_ues + 1)
+        csv_files = [output_path / f"{self.ue_imsis[ue_id - 1]}_metrics.csv" for ue_id in ue_ids]
+        args = (
+            ue_ids,
+            self._ue_rngs,
+            csv_files,
+            self.ue_imsis,
+            self.ue_types,
+            [self.num_samples] * self.num_ues,
+        )
+        if workers == 1 or self.num_ues <= 1:
+            list(map(_generate_and_write, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_generate_and_write, *args))
+        for csv_file in csv_files:
             logger.info(f"Saved {csv_file}")
 
         # Generate and save eNB metrics
         logger.info("Generating base station metrics...")
-        enb_metrics = self.generate_enb_metrics()
         enb_file = output_path / "enb_metrics.csv"
-
-        with open(enb_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=enb_metrics[0].keys())
-            writer.writeheader()
-            writer.writerows(enb_metrics)
+        self._write_csv(enb_file, self.generate_enb_metrics())
 
         logger.info(f"Saved {enb_file}")
 
@@ -194,6 +248,8 @@ def main():
                        help="Number of time samples (default 1000)")
     parser.add_argument("--seed", type=int, default=42,
                        help="Random seed")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Worker processes for per-UE generation (default: one per CPU)")
 
     args = parser.parse_args()
 
@@ -203,7 +259,7 @@ def main():
         seed=args.seed
     )
 
-    generator.save_as_csv(args.output)
+    generator.save_as_csv(args.output, workers=args.workers)
     return 0
 
 
@@ -9,12 +9,40 @@ UAV Policy xApp - 機器學習優化模組
 import numpy as np
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Iterable, Optional, Union
 import logging
 
+import orjson
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 欄位式流量表的欄位：(rsrp_serving, rsrp_best_neighbor, prb_utilization_serving, path_position)
+TRAFFIC_COLUMNS = ("rsrp_serving", "rsrp_best_neighbor", "prb_utilization_serving", "path_position")
+# 觀察值歸一化係數（與 TRAFFIC_COLUMNS 對應）
+_OBS_SCALE = np.array([-140.0, -140.0, 1.0, 1000.0], dtype=np.float32)
+
+
+def _traffic_row(record: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """從單筆流量記錄取出環境使用的欄位（含預設值）"""
+    radio = record.get("radio_snapshot", {})
+    return (
+        radio.get("rsrp_serving", -85.0),
+        radio.get("rsrp_best_neighbor", -90.0),
+        radio.get("prb_utilization_serving", 0.5),
+        record.get("path_position", 0.0),
+    )
+
+
+def traffic_table(records: Iterable[Dict[str, Any]], count: int = -1) -> np.ndarray:
+    """將流量記錄轉為 (N, 4) float32 欄位表，欄位順序見 TRAFFIC_COLUMNS"""
+    flat = np.fromiter(
+        (v for record in records for v in _traffic_row(record)),
+        dtype=np.float32,
+        count=-1 if count < 0 else 4 * count,
+    )
+    return flat.reshape(-1, len(TRAFFIC_COLUMNS))
+
 
 class PolicyOptimizationEnv:
     """
@@ -25,11 +53,17 @@ class PolicyOptimizationEnv:
     獎勵：throughput + latency_reduction - handover_penalty
     """
 
-    def __init__(self, traffic_data: List[Dict[str, Any]]):
+    def __init__(self, traffic_data: Union[np.ndarray, List[Dict[str, Any]]]):
+        # 接受流量記錄列表或 traffic_table() 產生的欄位表
+        if not isinstance(traffic_data, np.ndarray):
+            traffic_data = traffic_table(traffic_data, len(traffic_data))
         self.traffic_data = traffic_data
         self.current_idx = 0
         self.episode_length = 100
         self.steps = 0
+        # 預先歸一化的觀察表與重複使用的觀察緩衝區
+        self._obs_table = traffic_data / _OBS_SCALE
+        self._obs = np.empty(len(TRAFFIC_COLUMNS), dtype=np.float32)
 
     def reset(self):
         """重置環境"""
@@ -38,21 +72,15 @@ class PolicyOptimizationEnv:
         return self._get_observation()
 
     def _get_observation(self) -> np.ndarray:
-        """取得當前觀察"""
+        """取得當前觀察
+
+        回傳的緩衝區會在下一步被覆寫；需保留請自行 copy()。
+        """
         if self.current_idx >= len(self.traffic_data):
             self.current_idx = 0
 
-        record = self.traffic_data[self.current_idx]
-        radio = record.get("radio_snapshot", {})
-
-        obs = np.array([
-            radio.get("rsrp_serving", -85.0) / -140.0,  # 歸一化
-            radio.get("rsrp_best_neighbor", -90.0) / -140.0,
-            radio.get("prb_utilization_serving", 0.5),
-            record.get("path_position", 0.0) / 1000.0,
-        ], dtype=np.float32)
-
-        return obs
+        self._obs[:] = self._obs_table[self.current_idx]
+        return self._obs
 
     def step(self, action: np.ndarray) -> Tuple[np.ndarray, float, bool, Dict]:
         """執行動作"""
@@ -76,7 +104,6 @@ class PolicyOptimizationEnv:
             reward += 1.0
 
         # 避免不必要的切換
-        record = self.traffic_data[self.current_idx - 1]
         if action[0] == 0:  # 保持在當前基地台
             reward += 0.5
 
@@ -86,53 +113,55 @@ class PolicyOptimizationEnv:
 class MLOptimizer:
     """機器學習優化器"""
 
-    def __init__(self, traffic_data_file: str):
+    def __init__(self, traffic_data_file: str, seed: Optional[int] = None):
         self.traffic_data = self._load_traffic(traffic_data_file)
         self.env = PolicyOptimizationEnv(self.traffic_data)
+        self._rng = np.random.default_rng(seed)
 
-    def _load_traffic(self, filepath: str) -> List[Dict]:
-        """載入轉換後的流量資料"""
-        data = []
+    def _load_traffic(self, filepath: str) -> np.ndarray:
+        """載入轉換後的流量資料為欄位表（不保留逐筆 dict）"""
         try:
-            with open(filepath) as f:
+            with open(filepath, 'rb') as f:
                 if filepath.endswith('.jsonl'):
-                    for line in f:
-                        data.append(json.loads(line))
+                    lines = [line for line in f.read().splitlines() if line.strip()]
+                    data = traffic_table((orjson.loads(line) for line in lines), len(lines))
                 else:
-                    data = json.load(f)
+                    records = orjson.loads(f.read())
+                    data = traffic_table(records, len(records))
             logger.info(f"載入 {len(data)} 筆流量記錄")
             return data
         except Exception as e:
             logger.error(f"載入失敗：{e}")
-            return []
+            return traffic_table([])
 
     def train_simple_model(self, episodes: int = 100):
         """訓練簡單的決策模型"""
         logger.info(f"開始訓練（{episodes} episodes）...")
 
         rewards_history = []
+        window_reward = 0.0  # 最近 10 個 episode 的獎勵累計
 
         for episode in range(episodes):
             obs = self.env.reset()
             episode_reward = 0.0
 
-            for step in range(self.env.episode_length):
-                # 簡單的隨機策略（可替換為 DQN/PPO）
-                action = np.array([
-                    np.random.randint(0, 2),  # cell 選擇
-                    np.random.randint(5, 100)  # PRB 分配
-                ])
+            # 簡單的隨機策略（可替換為 DQN/PPO）：一次抽出整個 episode 的動作
+            # 欄位：[cell 選擇 (0-1), PRB 分配 (5-99)]
+            actions = self._rng.integers([0, 5], [2, 100], size=(self.env.episode_length, 2))
 
-                obs, reward, done, _ = self.env.step(action)
+            for step in range(self.env.episode_length):
+                obs, reward, done, _ = self.env.step(actions[step])
                 episode_reward += reward
 
                 if done:
                     break
 
             rewards_history.append(episode_reward)
+            window_reward += episode_reward
 
             if (episode + 1) % 10 == 0:
-                avg_reward = np.mean(rewards_history[-10:])
+                avg_reward = window_reward / 10
+                window_reward = 0.0
                 logger.info(f"Episode {episode + 1}/{episodes} - Avg Reward: {avg_reward:.2f}")
 
         logger.info("✓ 訓練完成")
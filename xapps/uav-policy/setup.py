@@ -11,11 +11,24 @@ setup(
     install_requires=[
         "flask>=2.3.0",
         "werkzeug>=2.3.0",
+        "orjson>=3.8.0",
+        "numpy>=1.24.0",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.58.0",
+        ],
+        "server": [
+            "gunicorn>=21.2.0",
+        ],
+        "asgi": [
+            "asgiref>=3.7.0",
+            "uvicorn[standard]>=0.23.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.3.0",
             "black>=23.7.0",
             "isort>=5.12.0",
             "flake8>=6.0.0",
@@ -24,6 +37,7 @@ setup(
     entry_points={
         "console_scripts": [
             "uav-policy=uav_policy.main:main",
+            "uav-policy-server=uav_policy.main:serve",
         ],
     },
 )
@@ -5,6 +5,7 @@ from .policy_engine import (
     FlightPlanPolicy,
     ServiceProfile,
     ResourceDecision,
+    ReasonFlag,
     simple_path_aware_policy,
     path_aware_rc_policy,
 )
@@ -0,0 +1,16 @@
+"""ASGI entry point for running the UAV policy xApp under uvicorn.
+
+    pip install 'uav-policy[asgi]'
+    uvicorn uav_policy.asgi:app --workers 4 --loop uvloop --http httptools
+
+The Flask app from ``create_app()`` (including its WSGI fast path for
+the hot endpoints) is adapted with asgiref's ``WsgiToAsgi``: uvloop and
+httptools own the sockets and HTTP parsing, and each request runs on the
+adapter's thread pool, so handlers and tests stay synchronous Flask code.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from uav_policy.server import create_app
+
+app = WsgiToAsgi(create_app())
@@ -0,0 +1,29 @@
+"""gunicorn settings for the UAV policy xApp (used by ``uav-policy-server``).
+
+Load with ``gunicorn -c python:uav_policy.gunicorn_conf 'uav_policy.server:create_app()'``.
+The same environment variables as the development server apply, plus
+SERVER_WORKERS / SERVER_THREADS to override the worker pool size and
+SERVER_KEEPALIVE for the idle keep-alive timeout (seconds).
+"""
+
+import os
+
+bind = f"{os.environ.get('SERVER_HOST', '0.0.0.0')}:{os.environ.get('SERVER_PORT', '5000')}"
+
+# One worker by default: cpu_count() reports the node's cores, not the
+# pod's CPU limit, and every worker holds its own decision history.
+# Handlers are CPU-bound (JSON + policy); threads overlap socket I/O
+workers = int(os.environ.get("SERVER_WORKERS", 1))
+worker_class = "gthread"
+threads = int(os.environ.get("SERVER_THREADS", 8))
+
+# Simulation bridges post indications back-to-back over one connection;
+# gunicorn owns the (hop-by-hop) Connection/Keep-Alive headers
+keepalive = int(os.environ.get("SERVER_KEEPALIVE", 30))
+
+# Let each worker accept on its own socket (SO_REUSEPORT)
+reuse_port = True
+
+loglevel = os.environ.get("LOG_LEVEL", "INFO").lower()
+accesslog = None
+errorlog = "-"
@@ -2,13 +2,18 @@
 
 This module starts the HTTP server to receive E2 indications
 and generate resource allocation decisions.
+
+`main` runs Flask's development server for local testing; `serve` replaces
+the process with gunicorn and is the production entry point
+(``uav-policy-server``).
 """
 
 import logging
 import os
+import shutil
+import sys
 from uav_policy.server import create_app
 
-
 # Configure logging
 logging.basicConfig(
     level=os.environ.get("LOG_LEVEL", "INFO"),
@@ -17,8 +22,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _is_production() -> bool:
+    return os.environ.get("XAPP_ENV", "development").lower() == "production"
+
+
 def main() -> None:
-    """Start the policy engine HTTP server."""
+    """Start the policy engine HTTP server (development only)."""
+    if _is_production():
+        logger.error(
+            "Refusing to run the Flask development server with XAPP_ENV=production; "
+            "use uav-policy-server instead."
+        )
+        sys.exit(1)
+
+    logger.warning("Using the Flask development server; use uav-policy-server in production.")
     logger.info("Starting UAV policy xApp server...")
 
     app = create_app()
@@ -28,11 +45,37 @@ def main() -> None:
     port = int(os.environ.get("SERVER_PORT", 5000))
     debug = os.environ.get("DEBUG", "false").lower() == "true"
 
-    logger.info(f"Server configuration: host={host}, port={port}, debug={debug}")
+    logger.info("Server configuration: host=%s, port=%s, debug=%s", host, port, debug)
 
     # Start server
     app.run(host=host, port=port, debug=debug, threaded=True)
 
 
+def serve() -> None:
+    """Exec gunicorn serving the policy engine app (see `uav_policy.gunicorn_conf`).
+
+    Every worker builds its own app and `PolicyEngineHandler`, so with
+    ``SERVER_WORKERS`` > 1 the ``/decisions`` and ``/stats`` history is per
+    worker; ``DECISION_LOG_PATH`` records every decision.
+    """
+    gunicorn = shutil.which("gunicorn")
+    if gunicorn is None:
+        logger.error("gunicorn not found; install with: pip install 'uav-policy[server]'")
+        sys.exit(1)
+
+    os.execv(
+        gunicorn,
+        [
+            gunicorn,
+            "--config",
+            "python:uav_policy.gunicorn_conf",
+            "uav_policy.server:create_app()",
+        ],
+    )
+
+
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["serve"]:
+        serve()
+    else:
+        main()
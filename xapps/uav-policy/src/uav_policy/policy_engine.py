@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from enum import IntFlag, auto
 from math import ceil, log2
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UavState:
     """Minimal UAV state used by the policy engine."""
 
@@ -17,7 +20,7 @@ class UavState:
     path_position: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RadioSnapshot:
     """Per-UAV view of the radio environment at a given time step."""
 
@@ -29,7 +32,7 @@ class RadioSnapshot:
     prb_utilization_slice: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PathSegmentPlan:
     """Planned serving cell and resource profile for a path segment."""
 
@@ -40,39 +43,216 @@ class PathSegmentPlan:
     base_prb_quota: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FlightPlanPolicy:
-    """Offline-derived flight-plan policy for a single UAV."""
+    """Offline-derived flight-plan policy for a single UAV.
+
+    Segment bounds are indexed at construction for `find_active_segment`;
+    treat ``segments`` as read-only afterwards.
+    """
 
     uav_id: str
     segments: List[PathSegmentPlan]
-
-
-@dataclass
+    _order: List[int] = field(init=False, repr=False, compare=False)
+    _starts: List[float] = field(init=False, repr=False, compare=False)
+    _ends: List[float] = field(init=False, repr=False, compare=False)
+    _bisectable: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Segment indices by start position; bounds are indexed in that order
+        segments = self.segments
+        order = sorted(range(len(segments)), key=lambda i: segments[i].start_pos)
+        starts = [segments[i].start_pos for i in order]
+        ends = [segments[i].end_pos for i in order]
+        object.__setattr__(self, "_order", order)
+        object.__setattr__(self, "_starts", starts)
+        object.__setattr__(self, "_ends", ends)
+        # A position then lies in at most one segment, so binary search finds
+        # the same segment as a first-match scan in the given order.
+        object.__setattr__(self, "_bisectable", all(e0 <= s1 for e0, s1 in zip(ends, starts[1:])))
+
+
+# Distinct SINR values remembered per ServiceProfile before starting over
+_PRB_CACHE_LIMIT = 4096
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceProfile:
-    """QoS profile for a UAV service (e.g., HD video uplink)."""
+    """QoS profile for a UAV service (e.g., HD video uplink).
+
+    PRB estimates for the profile's bitrate are cached per SINR value (see
+    `required_prb`); treat the profile as read-only.
+    """
 
     name: str
     target_bitrate_mbps: float
     min_sinr_db: float = 0.0
+    _prb_by_sinr: Dict[float, int] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
 
-
-@dataclass
+    def required_prb(self, sinr_db: float) -> int:
+        """`estimate_required_prb` for this profile's bitrate at ``sinr_db``.
+
+        One profile serves many UAVs whose reported SINR is quantized, so
+        the same few values recur; each is computed once.
+        """
+        cache = self._prb_by_sinr
+        quota = cache.get(sinr_db)
+        if quota is None:
+            if len(cache) >= _PRB_CACHE_LIMIT:
+                cache.clear()
+            quota = cache[sinr_db] = estimate_required_prb(self.target_bitrate_mbps, sinr_db)
+        return quota
+
+
+class ReasonFlag(IntFlag):
+    """Tags for the clauses of a `path_aware_rc_policy` reason, in text order."""
+
+    FOLLOW_PLAN = auto()
+    PLAN_NEIGHBOR_NOT_BETTER = auto()
+    PLAN_SERVING_NOT_OVERLOADED = auto()
+    SEGMENT_MATCH = auto()
+    NO_SEGMENT = auto()
+    REACTIVE_HANDOVER = auto()
+    REACTIVE_STAY = auto()
+    SLICE_FROM_UAV = auto()
+    SLICE_FROM_PLAN = auto()
+    NO_SLICE = auto()
+    PRB_FROM_SERVING = auto()
+    PRB_FROM_NEIGHBOR = auto()
+    SINR_BELOW_MIN = auto()
+    SERVICE_ESTIMATE = auto()
+    NO_SERVICE = auto()
+
+
+# Reason context tuple, filled by `path_aware_rc_policy`:
+# (prb_util, rsrp_delta_db, slice_id, sinr_db, min_sinr_db, service_name,
+#  target_bitrate_mbps, estimated_prb)
+_REASON_TEXT = {
+    ReasonFlag.FOLLOW_PLAN: lambda c: (
+        "Follow flight-plan cell; serving overloaded and neighbor stronger."
+    ),
+    ReasonFlag.PLAN_NEIGHBOR_NOT_BETTER: lambda c: (
+        "Flight-plan suggests different cell but neighbor not clearly better; stay on serving."
+    ),
+    ReasonFlag.PLAN_SERVING_NOT_OVERLOADED: lambda c: (
+        "Flight-plan suggests different cell but serving not overloaded; "
+        "stay on serving for stability."
+    ),
+    ReasonFlag.SEGMENT_MATCH: lambda c: "Serving cell matches flight-plan segment.",
+    ReasonFlag.NO_SEGMENT: lambda c: "No active flight-plan segment; using reactive policy only.",
+    ReasonFlag.REACTIVE_HANDOVER: lambda c: (
+        f"Reactive handover: serving overloaded (util={c[0]:.1%}), "
+        f"neighbor stronger by {c[1]:.1f} dB."
+    ),
+    ReasonFlag.REACTIVE_STAY: lambda c: (
+        "Staying on serving cell (not overloaded or neighbors not clearly better)."
+    ),
+    ReasonFlag.SLICE_FROM_UAV: lambda c: f"Using UAV slice_id={c[2]}.",
+    ReasonFlag.SLICE_FROM_PLAN: lambda c: f"Using slice from flight-plan segment: {c[2]}.",
+    ReasonFlag.NO_SLICE: lambda c: "No slice info; leaving slice_id unset.",
+    ReasonFlag.PRB_FROM_SERVING: lambda c: "Estimating PRB from serving-cell RSRP as SINR proxy.",
+    ReasonFlag.PRB_FROM_NEIGHBOR: lambda c: "Estimating PRB from best-neighbor RSRP as SINR proxy.",
+    ReasonFlag.SINR_BELOW_MIN: lambda c: (
+        f"Effective SINR ({c[3]:.1f} dB) below service minimum ({c[4]:.1f} dB)."
+    ),
+    ReasonFlag.SERVICE_ESTIMATE: lambda c: (
+        f"Service '{c[5]}' targets {c[6]:.2f} Mbps; estimated required PRB quota ≈ {c[7]}."
+    ),
+    ReasonFlag.NO_SERVICE: lambda c: (
+        "No ServiceProfile provided; using base quota from flight-plan or default."
+    ),
+}
+
+
+# ReasonFlag values as plain ints. `path_aware_rc_policy` ORs these and
+# converts the result once: every IntFlag `|` goes through Enum.__call__.
+_F = SimpleNamespace(**{name: flag.value for name, flag in ReasonFlag.__members__.items()})
+
+# Reason flags of the no-plan, no-service, not-overloaded outcome
+_STAY_NO_SLICE = (
+    ReasonFlag.NO_SEGMENT | ReasonFlag.REACTIVE_STAY | ReasonFlag.NO_SLICE | ReasonFlag.NO_SERVICE
+)
+_STAY_UAV_SLICE = (
+    ReasonFlag.NO_SEGMENT
+    | ReasonFlag.REACTIVE_STAY
+    | ReasonFlag.SLICE_FROM_UAV
+    | ReasonFlag.NO_SERVICE
+)
+
+
+def format_reason(flags: int, ctx: tuple = ()) -> str:
+    """Render reason flags (plus their numeric context) as the reason text."""
+    return " ".join(text(ctx) for flag, text in _REASON_TEXT.items() if flags & flag)
+
+
+@dataclass(init=False, eq=False, slots=True, frozen=True)
 class ResourceDecision:
-    """High-level decision about how to treat this UAV."""
+    """High-level decision about how to treat this UAV.
+
+    ``reason`` is either given as text or built lazily from ``reason_flags``
+    on first access, so callers that never read it skip the formatting.
+    """
 
     uav_id: str
     target_cell_id: str
     slice_id: Optional[str]
     prb_quota: Optional[int]
-    reason: str
+    reason_flags: int
+    _reason: Optional[str] = field(repr=False)
+    _reason_ctx: tuple = field(repr=False)
+
+    def __init__(
+        self,
+        uav_id: str,
+        target_cell_id: str,
+        slice_id: Optional[str],
+        prb_quota: Optional[int],
+        reason: Optional[str] = None,
+        reason_flags: int = 0,
+        reason_ctx: tuple = (),
+    ) -> None:
+        setattr_ = object.__setattr__
+        setattr_(self, "uav_id", uav_id)
+        setattr_(self, "target_cell_id", target_cell_id)
+        setattr_(self, "slice_id", slice_id)
+        setattr_(self, "prb_quota", prb_quota)
+        setattr_(self, "reason_flags", reason_flags)
+        setattr_(self, "_reason", reason)
+        setattr_(self, "_reason_ctx", reason_ctx)
+
+    @property
+    def reason(self) -> str:
+        reason = self._reason
+        if reason is None:
+            reason = format_reason(self.reason_flags, self._reason_ctx)
+            # Caching the rendered text does not change the decision's value.
+            object.__setattr__(self, "_reason", reason)
+        return reason
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResourceDecision):
+            return NotImplemented
+        return (self.uav_id, self.target_cell_id, self.slice_id, self.prb_quota, self.reason) == (
+            other.uav_id,
+            other.target_cell_id,
+            other.slice_id,
+            other.prb_quota,
+            other.reason,
+        )
 
 
 def find_active_segment(plan: FlightPlanPolicy, path_position: float) -> Optional[PathSegmentPlan]:
     """Return the active path segment for a given path position."""
-    for seg in plan.segments:
-        if seg.start_pos <= path_position < seg.end_pos:
-            return seg
+    if plan._bisectable:
+        i = bisect_right(plan._starts, path_position) - 1
+        if i >= 0 and path_position < plan._ends[i]:
+            return plan.segments[plan._order[i]]
+    else:
+        for seg in plan.segments:
+            if seg.start_pos <= path_position < seg.end_pos:
+                return seg
     if plan.segments:
         return plan.segments[-1]
     return None
@@ -143,12 +323,36 @@ def path_aware_rc_policy(
 ) -> ResourceDecision:
     """Path-aware RC policy implementing docs/algorithms.md."""
 
+    if plan is None and service is None and radio.prb_utilization_serving <= overloaded_threshold:
+        # Nothing to follow or budget for and serving not overloaded: the
+        # general path below would stay on serving with the minimum quota
+        slice_id = uav.slice_id
+        return ResourceDecision(
+            uav.uav_id,
+            radio.serving_cell_id,
+            slice_id,
+            max(min_prb_quota, min(min_prb_quota, max_prb_quota)),
+            None,
+            _STAY_UAV_SLICE if slice_id is not None else _STAY_NO_SLICE,
+            (
+                radio.prb_utilization_serving,
+                radio.rsrp_best_neighbor - radio.rsrp_serving,
+                slice_id,
+                None,
+                None,
+                None,
+                None,
+                None,
+            ),
+        )
+
     active_seg: Optional[PathSegmentPlan] = None
     if plan is not None and uav.path_position is not None:
         active_seg = find_active_segment(plan, uav.path_position)
 
     target_cell = radio.serving_cell_id
-    reason_parts: List[str] = []
+    flags = 0
+    rsrp_delta = radio.rsrp_best_neighbor - radio.rsrp_serving
 
     if active_seg is not None:
         planned_cell = active_seg.planned_cell_id
@@ -156,21 +360,15 @@ def path_aware_rc_policy(
             if radio.prb_utilization_serving > overloaded_threshold:
                 if radio.rsrp_best_neighbor > radio.rsrp_serving + hysteresis_db:
                     target_cell = planned_cell
-                    reason_parts.append(
-                        "Follow flight-plan cell; serving overloaded and neighbor stronger."
-                    )
+                    flags |= _F.FOLLOW_PLAN
                 else:
-                    reason_parts.append(
-                        "Flight-plan suggests different cell but neighbor not clearly better; stay on serving."
-                    )
+                    flags |= _F.PLAN_NEIGHBOR_NOT_BETTER
             else:
-                reason_parts.append(
-                    "Flight-plan suggests different cell but serving not overloaded; stay on serving for stability."
-                )
+                flags |= _F.PLAN_SERVING_NOT_OVERLOADED
         else:
-            reason_parts.append("Serving cell matches flight-plan segment.")
+            flags |= _F.SEGMENT_MATCH
     else:
-        reason_parts.append("No active flight-plan segment; using reactive policy only.")
+        flags |= _F.NO_SEGMENT
         # Apply reactive handover logic when no flight plan
         if (
             radio.prb_utilization_serving > overloaded_threshold
@@ -178,60 +376,60 @@ def path_aware_rc_policy(
             and radio.neighbor_cell_ids
         ):
             target_cell = radio.neighbor_cell_ids[0]
-            reason_parts.append(
-                f"Reactive handover: serving overloaded (util={radio.prb_utilization_serving:.1%}), "
-                f"neighbor stronger by {radio.rsrp_best_neighbor - radio.rsrp_serving:.1f} dB."
-            )
+            flags |= _F.REACTIVE_HANDOVER
         else:
-            reason_parts.append("Staying on serving cell (not overloaded or neighbors not clearly better).")
+            flags |= _F.REACTIVE_STAY
 
     target_slice: Optional[str]
     if uav.slice_id is not None:
         target_slice = uav.slice_id
-        reason_parts.append(f"Using UAV slice_id={uav.slice_id}.")
+        flags |= _F.SLICE_FROM_UAV
     elif active_seg is not None:
         target_slice = active_seg.slice_id
-        reason_parts.append(f"Using slice from flight-plan segment: {active_seg.slice_id}.")
+        flags |= _F.SLICE_FROM_PLAN
     else:
         target_slice = None
-        reason_parts.append("No slice info; leaving slice_id unset.")
+        flags |= _F.NO_SLICE
 
     base_quota = active_seg.base_prb_quota if active_seg is not None else min_prb_quota
     required_quota = base_quota
+    sinr_for_estimation = None
+    estimated_quota = None
 
     if service is not None:
         if target_cell == radio.serving_cell_id:
             sinr_for_estimation = radio.rsrp_serving
-            reason_parts.append("Estimating PRB from serving-cell RSRP as SINR proxy.")
+            flags |= _F.PRB_FROM_SERVING
         else:
             sinr_for_estimation = radio.rsrp_best_neighbor
-            reason_parts.append("Estimating PRB from best-neighbor RSRP as SINR proxy.")
+            flags |= _F.PRB_FROM_NEIGHBOR
 
         if sinr_for_estimation < service.min_sinr_db:
-            reason_parts.append(
-                f"Effective SINR ({sinr_for_estimation:.1f} dB) below service minimum ({service.min_sinr_db:.1f} dB)."
-            )
+            flags |= _F.SINR_BELOW_MIN
 
-        required_quota = estimate_required_prb(
-            target_bitrate_mbps=service.target_bitrate_mbps,
-            sinr_db=sinr_for_estimation,
-        )
-        reason_parts.append(
-            f"Service '{service.name}' targets {service.target_bitrate_mbps:.2f} Mbps; "
-            f"estimated required PRB quota ≈ {required_quota}."
-        )
+        estimated_quota = service.required_prb(sinr_for_estimation)
+        flags |= _F.SERVICE_ESTIMATE
 
-        required_quota = max(required_quota, base_quota)
+        required_quota = max(estimated_quota, base_quota)
     else:
-        reason_parts.append("No ServiceProfile provided; using base quota from flight-plan or default.")
+        flags |= _F.NO_SERVICE
 
     prb_quota = max(min_prb_quota, min(required_quota, max_prb_quota))
-    reason = " ".join(reason_parts)
 
     return ResourceDecision(
         uav_id=uav.uav_id,
         target_cell_id=target_cell,
         slice_id=target_slice,
         prb_quota=prb_quota,
-        reason=reason,
+        reason_flags=ReasonFlag(flags),
+        reason_ctx=(
+            radio.prb_utilization_serving,
+            rsrp_delta,
+            target_slice,
+            sinr_for_estimation,
+            service.min_sinr_db if service is not None else None,
+            service.name if service is not None else None,
+            service.target_bitrate_mbps if service is not None else None,
+            estimated_quota,
+        ),
     )
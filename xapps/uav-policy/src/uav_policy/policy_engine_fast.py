@@ -0,0 +1,450 @@
+"""Batched numeric core of `path_aware_rc_policy` for many UAVs per tick.
+
+Only the numbers are computed here: the handover choice as a target-cell
+code and the clamped PRB quota, one array element per UAV. Building
+`ResourceDecision` objects (cell ids, slice ids, reason strings) stays in
+`policy_engine`. numba is optional; without it a NumPy-vectorized
+equivalent is used.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import ceil, log2
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, cast
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .policy_engine import (
+    FlightPlanPolicy,
+    PathSegmentPlan,
+    RadioSnapshot,
+    ResourceDecision,
+    ServiceProfile,
+    UavState,
+    find_active_segment,
+)
+
+_Func = TypeVar("_Func", bound=Callable[..., Any])
+
+try:
+    from numba import njit, prange
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    _HAVE_NUMBA = False
+
+    def _no_jit(*args: Any, **kwargs: Any) -> Callable[[_Func], _Func]:
+        """No-op stand-in for ``numba.njit`` when numba is not installed."""
+
+        def decorator(func: _Func) -> _Func:
+            return func
+
+        return decorator
+
+    njit = _no_jit
+    prange = range
+
+
+# Target-cell codes returned by `decide_batch`.
+TARGET_SERVING = 0
+TARGET_PLANNED = 1
+TARGET_NEIGHBOR = 2
+
+# Short reason per target code; the batch path does not build the
+# per-UAV narrative that `path_aware_rc_policy` does.
+_BATCH_REASONS = {
+    TARGET_SERVING: "Stay on serving cell (batched path-aware policy).",
+    TARGET_PLANNED: "Follow flight-plan cell; serving overloaded and neighbor stronger.",
+    TARGET_NEIGHBOR: "Reactive handover: serving overloaded, neighbor stronger.",
+}
+
+# `simple_path_aware_policy` reasons, which are fixed per outcome anyway.
+_SIMPLE_BATCH_REASONS = {
+    TARGET_SERVING: "Stay on serving cell; load acceptable or neighbors not clearly better.",
+    TARGET_NEIGHBOR: "Serving cell overloaded, neighbor clearly stronger.",
+}
+
+
+@dataclass
+class RadioSnapshotBatch:
+    """Column (SoA) view of N `RadioSnapshot`s, one array element per UAV."""
+
+    serving_cell_id: List[str]
+    neighbor_cell_ids: List[List[str]]
+    rsrp_serving: np.ndarray
+    rsrp_best_neighbor: np.ndarray
+    prb_utilization_serving: np.ndarray
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Sequence[RadioSnapshot]) -> "RadioSnapshotBatch":
+        n = len(snapshots)
+        return cls(
+            serving_cell_id=[r.serving_cell_id for r in snapshots],
+            neighbor_cell_ids=[r.neighbor_cell_ids for r in snapshots],
+            rsrp_serving=np.fromiter((r.rsrp_serving for r in snapshots), np.float64, n),
+            rsrp_best_neighbor=np.fromiter(
+                (r.rsrp_best_neighbor for r in snapshots), np.float64, n
+            ),
+            prb_utilization_serving=np.fromiter(
+                (r.prb_utilization_serving for r in snapshots), np.float64, n
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.serving_cell_id)
+
+
+@dataclass
+class ResourceDecisionBatch:
+    """Column (SoA) form of N `ResourceDecision`s."""
+
+    uav_id: List[str]
+    target_cell_id: List[str]
+    slice_id: List[Optional[str]]
+    prb_quota: np.ndarray
+    target: np.ndarray  # TARGET_* code per UAV
+    reasons: Dict[int, str] = field(default_factory=lambda: _BATCH_REASONS, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.uav_id)
+
+    def to_decisions(self) -> List[ResourceDecision]:
+        """Materialize per-UAV `ResourceDecision` objects."""
+        return [
+            ResourceDecision(
+                uav_id=uav_id,
+                target_cell_id=cell,
+                slice_id=slice_id,
+                prb_quota=quota,
+                reason=self.reasons[code],
+            )
+            for uav_id, cell, slice_id, quota, code in zip(
+                self.uav_id,
+                self.target_cell_id,
+                self.slice_id,
+                self.prb_quota.tolist(),
+                self.target.tolist(),
+            )
+        ]
+
+
+# Spectral efficiency log2(1 + SINR) on a 0.1 dB grid over [-10, 40] dB.
+# Reported SINR/RSRP is usually quantized to 0.1 dB, so the compiled kernel
+# replaces pow/log2 with a table load for on-grid values. (Neither the
+# scalar policy nor the NumPy fallback gains from it: their pow/log2 are
+# already single C calls per value or per array.)
+_SE_LUT_MIN_DB = -10.0
+_SE_LUT_STEPS_PER_DB = 10.0
+_SE_LUT = np.log2(1.0 + 10.0 ** ((np.arange(501) / _SE_LUT_STEPS_PER_DB + _SE_LUT_MIN_DB) / 10.0))
+
+
+@njit(cache=True, fastmath=True)
+def estimate_required_prb_jit(target_bitrate_mbps, sinr_db, prb_bandwidth_hz=180e3):
+    """Compiled `policy_engine.estimate_required_prb` (same rough model)."""
+    if sinr_db < -10.0:
+        sinr_db = -10.0
+
+    scaled = (sinr_db - _SE_LUT_MIN_DB) * _SE_LUT_STEPS_PER_DB
+    idx = int(scaled + 0.5)
+    if idx < _SE_LUT.shape[0] and abs(scaled - idx) < 1e-6:
+        se_bps_per_hz = _SE_LUT[idx]
+    else:
+        se_bps_per_hz = log2(1.0 + 10.0 ** (sinr_db / 10.0))
+    if se_bps_per_hz <= 0:
+        return 1
+
+    throughput_per_prb_mbps = se_bps_per_hz * prb_bandwidth_hz / 1e6
+    if throughput_per_prb_mbps <= 0:
+        return 1
+
+    return max(1, int(ceil(target_bitrate_mbps / throughput_per_prb_mbps)))
+
+
+@lru_cache(maxsize=None)
+def _decide_kernel(
+    overloaded_threshold: float,
+    hysteresis_db: float,
+    min_prb_quota: int,
+    max_prb_quota: int,
+) -> Callable[..., Tuple[np.ndarray, np.ndarray]]:
+    """Kernel specialized on the policy thresholds.
+
+    The thresholds are closure constants, so numba folds them into the
+    compiled loop; one kernel is compiled (and disk-cached) per setting.
+    """
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def kernel(
+        prb_util,
+        rsrp_serving,
+        rsrp_neighbor,
+        has_neighbor,
+        has_segment,
+        plan_differs,
+        neighbor_is_serving,
+        seg_quota,
+        has_service,
+        target_bitrate_mbps,
+    ):
+        n = prb_util.shape[0]
+        target = np.empty(n, dtype=np.int8)
+        quota = np.empty(n, dtype=np.int64)
+        for i in prange(n):
+            hot = prb_util[i] > overloaded_threshold
+            stronger = rsrp_neighbor[i] > rsrp_serving[i] + hysteresis_db
+
+            code = TARGET_SERVING
+            if has_segment[i]:
+                if plan_differs[i] and hot and stronger:
+                    code = TARGET_PLANNED
+            elif hot and stronger and has_neighbor[i]:
+                code = TARGET_NEIGHBOR
+            target[i] = code
+
+            required = seg_quota[i] if has_segment[i] else min_prb_quota
+            if has_service[i]:
+                on_serving = code == TARGET_SERVING or (
+                    code == TARGET_NEIGHBOR and neighbor_is_serving[i]
+                )
+                sinr = rsrp_serving[i] if on_serving else rsrp_neighbor[i]
+                required = max(estimate_required_prb_jit(target_bitrate_mbps[i], sinr), required)
+
+            quota[i] = max(min_prb_quota, min(required, max_prb_quota))
+        return target, quota
+
+    return cast(Callable[..., Tuple[np.ndarray, np.ndarray]], kernel)
+
+
+def _decide_numpy(
+    prb_util: np.ndarray,
+    rsrp_serving: np.ndarray,
+    rsrp_neighbor: np.ndarray,
+    has_neighbor: np.ndarray,
+    has_segment: np.ndarray,
+    plan_differs: np.ndarray,
+    neighbor_is_serving: np.ndarray,
+    seg_quota: np.ndarray,
+    has_service: np.ndarray,
+    target_bitrate_mbps: np.ndarray,
+    overloaded_threshold: float,
+    hysteresis_db: float,
+    min_prb_quota: int,
+    max_prb_quota: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy equivalent of the `_decide_kernel` loop, used without numba."""
+    hot_and_stronger = (prb_util > overloaded_threshold) & (
+        rsrp_neighbor > rsrp_serving + hysteresis_db
+    )
+    target = np.full(prb_util.shape, TARGET_SERVING, dtype=np.int8)
+    target[has_segment & plan_differs & hot_and_stronger] = TARGET_PLANNED
+    target[~has_segment & hot_and_stronger & has_neighbor] = TARGET_NEIGHBOR
+
+    base = np.where(has_segment, seg_quota, min_prb_quota).astype(np.int64)
+    on_serving = (target == TARGET_SERVING) | ((target == TARGET_NEIGHBOR) & neighbor_is_serving)
+    sinr = np.maximum(np.where(on_serving, rsrp_serving, rsrp_neighbor), -10.0)
+    throughput_per_prb_mbps = np.log2(1.0 + 10.0 ** (sinr / 10.0)) * 180e3 / 1e6
+    bitrate = np.where(has_service, target_bitrate_mbps, 0.0)
+    estimated = np.maximum(1, np.ceil(bitrate / throughput_per_prb_mbps)).astype(np.int64)
+    required = np.where(has_service, np.maximum(estimated, base), base)
+
+    return target, np.clip(required, min_prb_quota, max_prb_quota)
+
+
+def decide_batch(
+    prb_util: ArrayLike,
+    rsrp_serving: ArrayLike,
+    rsrp_neighbor: ArrayLike,
+    has_neighbor: ArrayLike,
+    has_segment: ArrayLike,
+    plan_differs: ArrayLike,
+    neighbor_is_serving: ArrayLike,
+    seg_quota: ArrayLike,
+    has_service: ArrayLike,
+    target_bitrate_mbps: ArrayLike,
+    overloaded_threshold: float = 0.8,
+    hysteresis_db: float = 3.0,
+    min_prb_quota: int = 5,
+    max_prb_quota: int = 100,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Handover choice and PRB quota for N UAVs, as in `path_aware_rc_policy`.
+
+    Every input is a length-N array (or sequence, converted with ``np.asarray``):
+
+    - ``prb_util``, ``rsrp_serving``, ``rsrp_neighbor``: float radio inputs.
+    - ``has_neighbor``: the UAV reports at least one neighbor cell.
+    - ``has_segment``: a flight-plan segment is active for the UAV.
+    - ``plan_differs``: the active segment's cell is not the serving cell.
+    - ``neighbor_is_serving``: the first neighbor id equals the serving id.
+    - ``seg_quota``: the active segment's base PRB quota (ignored if none).
+    - ``has_service``/``target_bitrate_mbps``: the UAV's service profile.
+
+    Returns ``(target, prb_quota)``: int8 ``TARGET_*`` codes and int64 quotas.
+    """
+    args = (
+        np.asarray(prb_util, dtype=np.float64),
+        np.asarray(rsrp_serving, dtype=np.float64),
+        np.asarray(rsrp_neighbor, dtype=np.float64),
+        np.asarray(has_neighbor, dtype=np.bool_),
+        np.asarray(has_segment, dtype=np.bool_),
+        np.asarray(plan_differs, dtype=np.bool_),
+        np.asarray(neighbor_is_serving, dtype=np.bool_),
+        np.asarray(seg_quota, dtype=np.int64),
+        np.asarray(has_service, dtype=np.bool_),
+        np.asarray(target_bitrate_mbps, dtype=np.float64),
+    )
+    if _HAVE_NUMBA:
+        kernel = _decide_kernel(
+            float(overloaded_threshold),
+            float(hysteresis_db),
+            int(min_prb_quota),
+            int(max_prb_quota),
+        )
+        return kernel(*args)
+    return _decide_numpy(*args, overloaded_threshold, hysteresis_db, min_prb_quota, max_prb_quota)
+
+
+def find_active_segment_indices(plan: FlightPlanPolicy, path_positions) -> np.ndarray:
+    """Vectorized `find_active_segment`: segment index per path position.
+
+    One ``np.searchsorted`` over the plan's sorted segment starts; positions outside
+    every segment map to the last segment, and -1 means the plan is empty.
+    """
+    positions = np.asarray(path_positions, dtype=np.float64)
+    n_segments = len(plan.segments)
+    if n_segments == 0:
+        return np.full(positions.shape, -1, dtype=np.int64)
+    if not plan._bisectable:
+        index = {id(seg): i for i, seg in enumerate(plan.segments)}
+        return np.array(
+            [index[id(find_active_segment(plan, pos))] for pos in positions.tolist()],
+            dtype=np.int64,
+        )
+
+    starts = np.asarray(plan._starts, dtype=np.float64)
+    ends = np.asarray(plan._ends, dtype=np.float64)
+    idx = np.searchsorted(starts, positions, side="right") - 1
+    clipped = np.maximum(idx, 0)
+    hit = (idx >= 0) & (positions < ends[clipped])
+    return np.where(hit, np.asarray(plan._order, dtype=np.int64)[clipped], n_segments - 1)
+
+
+def simple_path_aware_policy_batch(
+    uavs: Sequence[UavState],
+    radio: RadioSnapshotBatch,
+    overloaded_threshold: float = 0.8,
+    hysteresis_db: float = 3.0,
+) -> ResourceDecisionBatch:
+    """`simple_path_aware_policy` for N UAVs, as boolean masks over the batch."""
+    n = len(uavs)
+    if len(radio) != n:
+        raise ValueError("radio batch and uavs must have the same length")
+
+    has_neighbor = np.fromiter((bool(ids) for ids in radio.neighbor_cell_ids), np.bool_, n)
+    handover = (
+        (radio.prb_utilization_serving > overloaded_threshold)
+        & (radio.rsrp_best_neighbor > radio.rsrp_serving + hysteresis_db)
+        & has_neighbor
+    )
+    return ResourceDecisionBatch(
+        uav_id=[uav.uav_id for uav in uavs],
+        target_cell_id=[
+            ids[0] if moved else serving
+            for moved, ids, serving in zip(
+                handover.tolist(), radio.neighbor_cell_ids, radio.serving_cell_id
+            )
+        ],
+        slice_id=[uav.slice_id for uav in uavs],
+        prb_quota=np.full(n, 20, dtype=np.int64),
+        target=np.where(handover, TARGET_NEIGHBOR, TARGET_SERVING).astype(np.int8),
+        reasons=_SIMPLE_BATCH_REASONS,
+    )
+
+
+def path_aware_rc_policy_batch(
+    uavs: Sequence[UavState],
+    radio: RadioSnapshotBatch,
+    plans: Optional[Sequence[Optional[FlightPlanPolicy]]] = None,
+    services: Optional[Sequence[Optional[ServiceProfile]]] = None,
+    overloaded_threshold: float = 0.8,
+    hysteresis_db: float = 3.0,
+    min_prb_quota: int = 5,
+    max_prb_quota: int = 100,
+) -> ResourceDecisionBatch:
+    """`path_aware_rc_policy` for N UAVs; ``plans``/``services`` align with ``uavs``.
+
+    Target cell, slice and PRB quota match the scalar policy; the numeric
+    core runs in `decide_batch`.
+    """
+    n = len(uavs)
+    if len(radio) != n:
+        raise ValueError("radio batch and uavs must have the same length")
+    plans = plans if plans is not None else [None] * n
+    services = services if services is not None else [None] * n
+
+    # One vectorized segment lookup per distinct plan (UAVs often share one)
+    rows_by_plan: Dict[int, Tuple[FlightPlanPolicy, List[int], List[float]]] = {}
+    for i, (uav, plan) in enumerate(zip(uavs, plans)):
+        if plan is not None and uav.path_position is not None:
+            _, rows, positions = rows_by_plan.setdefault(id(plan), (plan, [], []))
+            rows.append(i)
+            positions.append(uav.path_position)
+    segments: List[Optional[PathSegmentPlan]] = [None] * n
+    for plan, rows, positions in rows_by_plan.values():
+        indices = find_active_segment_indices(plan, positions).tolist()
+        for i, seg_index in zip(rows, indices):
+            segments[i] = plan.segments[seg_index] if seg_index >= 0 else None
+    first_neighbor = [ids[0] if ids else None for ids in radio.neighbor_cell_ids]
+
+    target, prb_quota = decide_batch(
+        prb_util=radio.prb_utilization_serving,
+        rsrp_serving=radio.rsrp_serving,
+        rsrp_neighbor=radio.rsrp_best_neighbor,
+        has_neighbor=[ids is not None for ids in first_neighbor],
+        has_segment=[seg is not None for seg in segments],
+        plan_differs=[
+            seg is not None and seg.planned_cell_id != serving
+            for seg, serving in zip(segments, radio.serving_cell_id)
+        ],
+        neighbor_is_serving=[
+            nb == serving for nb, serving in zip(first_neighbor, radio.serving_cell_id)
+        ],
+        seg_quota=[seg.base_prb_quota if seg is not None else 0 for seg in segments],
+        has_service=[svc is not None for svc in services],
+        target_bitrate_mbps=[
+            svc.target_bitrate_mbps if svc is not None else 0.0 for svc in services
+        ],
+        overloaded_threshold=overloaded_threshold,
+        hysteresis_db=hysteresis_db,
+        min_prb_quota=min_prb_quota,
+        max_prb_quota=max_prb_quota,
+    )
+
+    # TARGET_PLANNED implies an active segment and TARGET_NEIGHBOR a neighbor
+    target_cell_id = [
+        (
+            serving
+            if code == TARGET_SERVING
+            else (
+                cast(PathSegmentPlan, seg).planned_cell_id
+                if code == TARGET_PLANNED
+                else cast(str, nb)
+            )
+        )
+        for code, serving, seg, nb in zip(
+            target.tolist(), radio.serving_cell_id, segments, first_neighbor
+        )
+    ]
+    slice_id = [
+        uav.slice_id if uav.slice_id is not None else (seg.slice_id if seg is not None else None)
+        for uav, seg in zip(uavs, segments)
+    ]
+    return ResourceDecisionBatch(
+        uav_id=[uav.uav_id for uav in uavs],
+        target_cell_id=target_cell_id,
+        slice_id=slice_id,
+        prb_quota=prb_quota,
+        target=target,
+    )
@@ -3,178 +3,501 @@
 Performance Benchmark Suite for UAV Policy xApp
 
 Tests:
-1. Latency: P50, P95, P99 for decision processing
+0. Cold start: first request on a new connection
+1. Latency: P50, P95, P99 for decision processing (after warmup)
 2. Throughput: Requests per second
 3. Memory: Baseline and per-decision overhead
 4. Scalability: Performance with increasing UAV count
 """
 
+import argparse
+import asyncio
+import orjson
+import os
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
 import time
 import statistics
-import json
-from typing import List, Dict, Any
+import math
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import List, Dict, Any, Tuple, Union
 import sys
 
-BASE_URL = "http://localhost:5000"
+try:
+    import httpx
+except ImportError:  # optional: only needed for BENCH_HTTP2=1
+    httpx = None
+
+BASE_URL = os.environ.get("BENCH_BASE_URL", "http://localhost:5000")
 INDICATION_ENDPOINT = f"{BASE_URL}/e2/indication"
+BATCH_ENDPOINT = f"{BASE_URL}/api/v1/e2/indications:batch"
 HEALTH_ENDPOINT = f"{BASE_URL}/health"
 
+# Bodies are pre-serialized with orjson and sent as-is
+_HEADERS = {"Content-Type": "application/json"}
 
-def create_indication(uav_id: str, path_pos: float = 500.0) -> Dict[str, Any]:
-    """Create a standard test indication."""
-    return {
-        "uav_id": uav_id,
-        "position": {"x": 100.0 + path_pos / 10, "y": 200.0, "z": 50.0},
-        "path_position": path_pos,
-        "slice_id": "slice-eMBB",
-        "radio_snapshot": {
-            "serving_cell_id": "cell_001",
-            "neighbor_cell_ids": ["cell_002", "cell_003"],
-            "rsrp_serving": -85.0,
-            "rsrp_best_neighbor": -90.0,
-            "prb_utilization_serving": 0.4,
-        }
-    }
 
+class RequestsClient:
+    """Keep-alive requests.Session, so timings measure the xApp rather than
+    a TCP handshake per request."""
 
-def benchmark_latency(num_requests: int = 100) -> Dict[str, float]:
-    """Benchmark decision latency."""
-    print("\n" + "="*70)
-    print("BENCHMARK 1: Latency (Processing Time)")
-    print("="*70)
+    errors = (requests.exceptions.RequestException,)
 
-    latencies = []
+    def __init__(self) -> None:
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=64, pool_maxsize=64))
+        self.session.headers["Connection"] = "keep-alive"
 
-    for i in range(num_requests):
-        indication = create_indication(f"BENCH-LAT-{i}")
+    def post(self, url: str, body: bytes) -> Tuple[int, bytes]:
+        response = self.session.post(url, data=body, headers=_HEADERS, timeout=5)
+        return response.status_code, response.content
 
-        start = time.perf_counter()
-        response = requests.post(INDICATION_ENDPOINT, json=indication)
-        end = time.perf_counter()
+    def get(self, url: str) -> Tuple[int, bytes]:
+        response = self.session.get(url, timeout=5)
+        return response.status_code, response.content
 
-        latency_ms = (end - start) * 1000
-        latencies.append(latency_ms)
+    def close(self) -> None:
+        self.session.close()
 
-        if i % 20 == 0:
-            print(f"  Request {i+1}/{num_requests}: {latency_ms:.2f} ms")
 
-        if response.status_code != 200:
-            print(f"  ERROR: Request {i} failed with status {response.status_code}")
-            return {}
+class Urllib3Client:
+    """urllib3 pool used directly, skipping requests' per-call request
+    preparation (cookies, hooks, environment lookups)."""
 
-    p50 = statistics.median(latencies)
-    p95 = sorted(latencies)[int(num_requests * 0.95)]
-    p99 = sorted(latencies)[int(num_requests * 0.99)]
-    mean = statistics.mean(latencies)
-    stdev = statistics.stdev(latencies) if len(latencies) > 1 else 0.0
+    errors = (urllib3.exceptions.HTTPError,)
+
+    def __init__(self) -> None:
+        self.pool = urllib3.PoolManager(num_pools=4, maxsize=64)
+
+    def post(self, url: str, body: bytes) -> Tuple[int, bytes]:
+        response = self.pool.request("POST", url, body=body, headers=_HEADERS, timeout=5.0)
+        return response.status, response.data
+
+    def get(self, url: str) -> Tuple[int, bytes]:
+        response = self.pool.request("GET", url, timeout=5.0)
+        return response.status, response.data
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+CLIENTS = {"requests": RequestsClient, "urllib3": Urllib3Client}
+Client = Union[RequestsClient, Urllib3Client]
+
+# Multiplex the throughput benchmark over one HTTP/2 connection (httpx[http2]);
+# needs an h2-terminating front such as the nginx config in DEPLOYMENT_GUIDE.md
+USE_HTTP2 = os.environ.get("BENCH_HTTP2") == "1"
 
-    print(f"\n  Total Requests: {num_requests}")
-    print(f"  Mean:           {mean:.2f} ms")
-    print(f"  Median (P50):   {p50:.2f} ms")
-    print(f"  P95:            {p95:.2f} ms")
-    print(f"  P99:            {p99:.2f} ms")
-    print(f"  Std Dev:        {stdev:.2f} ms")
-    print(f"  Min:            {min(latencies):.2f} ms")
-    print(f"  Max:            {max(latencies):.2f} ms")
 
+_INDICATION_TEMPLATE: Dict[str, Any] = {
+    "uav_id": None,
+    "position": {"x": None, "y": 200.0, "z": 50.0},
+    "path_position": None,
+    "slice_id": "slice-eMBB",
+    "radio_snapshot": {
+        "serving_cell_id": "cell_001",
+        "neighbor_cell_ids": ["cell_002", "cell_003"],
+        "rsrp_serving": -85.0,
+        "rsrp_best_neighbor": -90.0,
+        "prb_utilization_serving": 0.4,
+    }
+}
+
+
+def create_indication(uav_id: str, path_pos: float = 500.0) -> Dict[str, Any]:
+    """Create a standard test indication.
+
+    Only the top level and ``position`` are copied from the template;
+    ``radio_snapshot`` is shared between indications and must not be mutated.
+    """
+    indication = _INDICATION_TEMPLATE.copy()
+    indication["uav_id"] = uav_id
+    indication["path_position"] = path_pos
+    position = _INDICATION_TEMPLATE["position"].copy()
+    position["x"] = 100.0 + path_pos / 10
+    indication["position"] = position
+    return indication
+
+
+# Untimed requests sent before benchmark_latency starts measuring; cold-start
+# cost is measured on its own by benchmark_cold_start
+WARMUP_REQUESTS = 10
+
+# Above this many requests benchmark_latency streams samples into a
+# LatencyHistogram instead of keeping every one (soak runs)
+EXACT_SAMPLE_LIMIT = 100_000
+
+
+class LatencyHistogram:
+    """Streaming latency summary in O(1) memory.
+
+    Samples land in log-spaced buckets (1% wide, 1 us to ~7 min), so
+    percentiles are accurate to about 1%; count, mean, stdev (Welford),
+    min and max are exact.
+    """
+
+    _MIN_NS = 1_000
+    _LOG_GROWTH = math.log(1.01)
+    _BUCKETS = 2_000
+
+    def __init__(self) -> None:
+        self.counts = np.zeros(self._BUCKETS, dtype=np.int64)
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, latency_ns: int) -> None:
+        ms = latency_ns / 1e6
+        self.n += 1
+        delta = ms - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (ms - self.mean)
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+        bucket = int(math.log(max(latency_ns, self._MIN_NS) / self._MIN_NS) / self._LOG_GROWTH)
+        self.counts[min(bucket, self._BUCKETS - 1)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile in ms (bucket midpoint, clamped to min/max)."""
+        rank = max(1, math.ceil(q * self.n))
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank))
+        ms = self._MIN_NS * math.exp((bucket + 0.5) * self._LOG_GROWTH) / 1e6
+        return min(max(ms, self.min), self.max)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "mean": self.mean,
+            "stdev": math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0,
+            "min": self.min,
+            "max": self.max
+        }
+
+
+def _exact_summary(latencies_ns: np.ndarray) -> Dict[str, float]:
+    """Latency summary in ms from all samples (interpolated percentiles)."""
+    latencies = latencies_ns.astype(np.float64) / 1e6
+    # Partition-based, no full sort
+    p50, p95, p99 = (float(q) for q in np.quantile(latencies, [0.5, 0.95, 0.99]))
     return {
         "p50": p50,
         "p95": p95,
         "p99": p99,
-        "mean": mean,
-        "stdev": stdev,
-        "min": min(latencies),
-        "max": max(latencies)
+        "mean": float(latencies.mean()),
+        "stdev": float(latencies.std(ddof=1)) if latencies.size > 1 else 0.0,
+        "min": float(latencies.min()),
+        "max": float(latencies.max())
     }
 
 
-def benchmark_throughput(duration_seconds: int = 10) -> Dict[str, float]:
-    """Benchmark requests per second."""
+def benchmark_cold_start(client: Client) -> Dict[str, float]:
+    """Benchmark the first request on a new connection (handshake included).
+
+    Uses a fresh client of the same kind as ``client``, whose warm pool
+    would otherwise hide the connection setup.
+    """
     print("\n" + "="*70)
-    print("BENCHMARK 2: Throughput (Requests Per Second)")
+    print("BENCHMARK 0: Cold Start (First Request on a New Connection)")
+    print("="*70)
+
+    body = orjson.dumps(create_indication("BENCH-COLD"))
+    cold_client = type(client)()
+    try:
+        start = time.perf_counter_ns()
+        status, _ = cold_client.post(INDICATION_ENDPOINT, body)
+        first_ms = (time.perf_counter_ns() - start) / 1e6
+
+        start = time.perf_counter_ns()
+        cold_client.post(INDICATION_ENDPOINT, body)
+        reused_ms = (time.perf_counter_ns() - start) / 1e6
+    finally:
+        cold_client.close()
+
+    if status != 200:
+        print(f"  ERROR: Cold-start request failed with status {status}")
+        return {}
+
+    print(f"  First Request:  {first_ms:.2f} ms")
+    print(f"  Reused Conn:    {reused_ms:.2f} ms")
+
+    return {
+        "first_request_ms": first_ms,
+        "reused_connection_ms": reused_ms
+    }
+
+
+def benchmark_latency(client: Client, num_requests: int = 100) -> Dict[str, float]:
+    """Benchmark steady-state decision latency (after WARMUP_REQUESTS)."""
+    print("\n" + "="*70)
+    print("BENCHMARK 1: Latency (Processing Time)")
     print("="*70)
 
+    streaming = num_requests > EXACT_SAMPLE_LIMIT
+    if streaming:
+        histogram = LatencyHistogram()
+    else:
+        # Raw perf_counter_ns durations; converted to ms once after the loop
+        latencies_ns = np.empty(num_requests, dtype=np.int64)
+
+    # Open the pooled connection and warm server-side lazy paths before timing
+    warmup_body = orjson.dumps(create_indication("BENCH-LAT-WARMUP"))
+    for _ in range(WARMUP_REQUESTS):
+        client.post(INDICATION_ENDPOINT, warmup_body)
+
+    # Progress is printed at 1 Hz from another thread so terminal I/O never
+    # lands inside a timed request
+    completed = 0
+    done = threading.Event()
+
+    def report_progress() -> None:
+        while not done.wait(1.0):
+            print(f"  Request {completed}/{num_requests}...")
+
+    reporter = threading.Thread(target=report_progress, daemon=True)
+    reporter.start()
+    try:
+        for i in range(num_requests):
+            indication = create_indication(f"BENCH-LAT-{i}")
+
+            start = time.perf_counter_ns()
+            status, _ = client.post(INDICATION_ENDPOINT, orjson.dumps(indication))
+            latency_ns = time.perf_counter_ns() - start
+            if streaming:
+                histogram.add(latency_ns)
+            else:
+                latencies_ns[i] = latency_ns
+            completed = i + 1
+
+            if status != 200:
+                print(f"  ERROR: Request {i} failed with status {status}")
+                return {}
+    finally:
+        done.set()
+        reporter.join()
+
+    summary = histogram.summary() if streaming else _exact_summary(latencies_ns)
+
+    print(f"\n  Total Requests: {num_requests}")
+    print(f"  Mean:           {summary['mean']:.2f} ms")
+    print(f"  Median (P50):   {summary['p50']:.2f} ms")
+    print(f"  P95:            {summary['p95']:.2f} ms")
+    print(f"  P99:            {summary['p99']:.2f} ms")
+    print(f"  Std Dev:        {summary['stdev']:.2f} ms")
+    print(f"  Min:            {summary['min']:.2f} ms")
+    print(f"  Max:            {summary['max']:.2f} ms")
+
+    return summary
+
+
+# Throughput bodies differ only in uav_id, so serialize one indication with a
+# placeholder id and splice each new id into the bytes. Only valid while
+# uav_id is the sole varying field.
+_TPS_ID_PATTERN = b'"uav_id":"__ID__"'
+_TPS_TEMPLATE = orjson.dumps(create_indication("__ID__"))
+
+
+def _throughput_body(uav_id: str) -> bytes:
+    return _TPS_TEMPLATE.replace(_TPS_ID_PATTERN, b'"uav_id":"%s"' % uav_id.encode())
+
+
+def _throughput_worker(client: Client, worker_id: int, deadline_ns: int) -> Tuple[int, List[int]]:
+    """Post indications back-to-back until deadline_ns; return (successes, times_ns)."""
     request_count = 0
-    start_time = time.perf_counter()
     request_times = []
 
-    print(f"  Running for {duration_seconds} seconds...")
-
-    while time.perf_counter() - start_time < duration_seconds:
-        indication = create_indication(f"BENCH-TPS-{request_count}")
+    while time.perf_counter_ns() < deadline_ns:
+        body = _throughput_body(f"BENCH-TPS-{worker_id}-{request_count}")
 
-        req_start = time.perf_counter()
+        req_start = time.perf_counter_ns()
         try:
-            response = requests.post(INDICATION_ENDPOINT, json=indication, timeout=5)
-            req_end = time.perf_counter()
-            request_times.append((req_end - req_start) * 1000)
+            status, _ = client.post(INDICATION_ENDPOINT, body)
+            request_times.append(time.perf_counter_ns() - req_start)
 
-            if response.status_code == 200:
+            if status == 200:
                 request_count += 1
             else:
-                print(f"  Request {request_count} failed: {response.status_code}")
+                print(f"  Worker {worker_id} request {request_count} failed: {status}")
 
-        except requests.exceptions.RequestException as e:
-            print(f"  Request error: {e}")
+        except client.errors as e:
+            print(f"  Worker {worker_id} request error: {e}")
             break
 
-    elapsed = time.perf_counter() - start_time
+    return request_count, request_times
+
+
+async def _throughput_http2(
+    concurrency: int, deadline_ns: int
+) -> Tuple[str, List[Tuple[int, List[int]]]]:
+    """Run ``concurrency`` coroutines as streams on one HTTP/2 connection.
+
+    Returns the negotiated HTTP version and per-worker (successes, times_ns).
+    """
+    async with httpx.AsyncClient(http2=True, base_url=BASE_URL, timeout=5.0) as client:
+        http_version = (await client.get("/health")).http_version
+
+        async def worker(worker_id: int) -> Tuple[int, List[int]]:
+            request_count = 0
+            request_times = []
+            while time.perf_counter_ns() < deadline_ns:
+                body = _throughput_body(f"BENCH-TPS-{worker_id}-{request_count}")
+                req_start = time.perf_counter_ns()
+                try:
+                    response = await client.post("/e2/indication", content=body, headers=_HEADERS)
+                except httpx.HTTPError as e:
+                    print(f"  Worker {worker_id} request error: {e}")
+                    break
+                request_times.append(time.perf_counter_ns() - req_start)
+                if response.status_code == 200:
+                    request_count += 1
+                else:
+                    print(
+                        f"  Worker {worker_id} request {request_count} failed: "
+                        f"{response.status_code}"
+                    )
+            return request_count, request_times
+
+        return http_version, await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+
+def benchmark_throughput(
+    client: Client, duration_seconds: int = 10, concurrency: int = 32
+) -> Dict[str, float]:
+    """Benchmark requests per second with concurrent in-flight requests.
+
+    A single serial client can never exceed 1 / RTT, so ``concurrency``
+    workers share the pooled session and post until the deadline. With
+    BENCH_HTTP2=1 the workers are coroutines multiplexed over one HTTP/2
+    connection instead (httpx falls back to HTTP/1.1 if h2 is not offered).
+    """
+    print("\n" + "="*70)
+    print("BENCHMARK 2: Throughput (Requests Per Second)")
+    print("="*70)
+
+    if USE_HTTP2 and httpx is None:
+        print("  BENCH_HTTP2=1 needs httpx[http2]; using pooled HTTP/1.1 keep-alive")
+    http2 = USE_HTTP2 and httpx is not None
+
+    print(f"  Running for {duration_seconds} seconds with {concurrency} workers...")
+
+    start_ns = time.perf_counter_ns()
+    deadline_ns = start_ns + duration_seconds * 1_000_000_000
+    if http2:
+        http_version, results = asyncio.run(_throughput_http2(concurrency, deadline_ns))
+    else:
+        http_version = "HTTP/1.1"
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(
+                pool.map(
+                    partial(_throughput_worker, client),
+                    range(concurrency),
+                    [deadline_ns] * concurrency,
+                )
+            )
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+
+    request_count = sum(count for count, _ in results)
+    request_times = np.fromiter((t for _, times in results for t in times), dtype=np.int64)
     rps = request_count / elapsed
-    mean_req_time = statistics.mean(request_times) if request_times else 0
+    worker_rps = [count / elapsed for count, _ in results]
+    mean_req_time = float(request_times.mean()) / 1e6 if request_times.size else 0
 
     print(f"\n  Elapsed Time:     {elapsed:.2f} seconds")
+    print(f"  Workers:          {concurrency} ({http_version})")
     print(f"  Total Requests:   {request_count}")
     print(f"  RPS:              {rps:.1f} req/sec")
+    print(f"  RPS per Worker:   {statistics.mean(worker_rps):.1f} req/sec "
+          f"(min {min(worker_rps):.1f}, max {max(worker_rps):.1f})")
     print(f"  Mean Request:     {mean_req_time:.2f} ms")
 
     return {
         "elapsed_seconds": elapsed,
+        "concurrency": concurrency,
+        "http_version": http_version,
         "request_count": request_count,
         "rps": rps,
+        "rps_per_worker": worker_rps,
         "mean_request_time_ms": mean_req_time
     }
 
 
-def benchmark_concurrent_uavs(num_uavs: int = 50) -> Dict[str, Any]:
-    """Benchmark with increasing number of concurrent UAVs."""
+def _timed_post(client: Client, indication: Dict[str, Any]) -> Tuple[int, int]:
+    """Post one indication; return (status_code, elapsed_ns)."""
+    start = time.perf_counter_ns()
+    status, _ = client.post(INDICATION_ENDPOINT, orjson.dumps(indication))
+    return status, time.perf_counter_ns() - start
+
+
+def benchmark_concurrent_uavs(client: Client, num_uavs: int = 50) -> Dict[str, Any]:
+    """Benchmark a swarm of UAVs reporting at the same time (one thread each)."""
     print("\n" + "="*70)
     print(f"BENCHMARK 3: Scalability ({num_uavs} Concurrent UAVs)")
     print("="*70)
 
-    latencies = []
+    indications = [
+        create_indication(f"BENCH-UAV-{i:03d}", path_pos=100.0 + i*10) for i in range(num_uavs)
+    ]
 
     print(f"  Simulating {num_uavs} UAVs...")
 
-    for i in range(num_uavs):
-        indication = create_indication(f"BENCH-UAV-{i:03d}", path_pos=100.0 + i*10)
-
-        start = time.perf_counter()
-        response = requests.post(INDICATION_ENDPOINT, json=indication)
-        end = time.perf_counter()
-
-        latency_ms = (end - start) * 1000
-        latencies.append(latency_ms)
-
-        if response.status_code != 200:
-            print(f"  ERROR: UAV {i} request failed")
-            return {}
-
-    mean = statistics.mean(latencies)
-    p99 = sorted(latencies)[int(num_uavs * 0.99)]
+    with ThreadPoolExecutor(max_workers=num_uavs) as pool:
+        start_ns = time.perf_counter_ns()
+        futures = {
+            pool.submit(_timed_post, client, indication): i
+            for i, indication in enumerate(indications)
+        }
+        latencies_ns = np.empty(num_uavs, dtype=np.int64)
+        failed = []
+        for future in as_completed(futures):
+            i = futures[future]
+            status, latencies_ns[i] = future.result()
+            if status != 200:
+                failed.append(i)
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+
+    if failed:
+        print(f"  ERROR: UAV request(s) failed: {sorted(failed)}")
+        return {}
+
+    latencies = latencies_ns.astype(np.float64) / 1e6
+    mean = float(latencies.mean())
+    p99 = float(np.quantile(latencies, 0.99))
+    swarm_rps = num_uavs / elapsed
 
     print(f"\n  Total UAVs:     {num_uavs}")
     print(f"  Mean Latency:   {mean:.2f} ms")
     print(f"  P99 Latency:    {p99:.2f} ms")
+    print(f"  Wall Clock:     {elapsed * 1000:.2f} ms")
+    print(f"  Swarm RPS:      {swarm_rps:.1f} req/sec")
+
+    # The same burst as one batch request (None if the server lacks the endpoint)
+    start_ns = time.perf_counter_ns()
+    status, _ = client.post(BATCH_ENDPOINT, orjson.dumps({"indications": indications}))
+    batch_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    if status == 200:
+        print(f"  Batch Request:  {batch_ms:.2f} ms for {num_uavs} UAVs")
+    else:
+        print(f"  Batch Request:  unavailable (HTTP {status})")
+        batch_ms = None
 
     return {
         "num_uavs": num_uavs,
         "mean_latency_ms": mean,
-        "p99_latency_ms": p99
+        "p99_latency_ms": p99,
+        "elapsed_ms": elapsed * 1000,
+        "swarm_rps": swarm_rps,
+        "batch_ms": batch_ms
     }
 
 
-def benchmark_service_profile_overhead() -> Dict[str, float]:
+def benchmark_service_profile_overhead(client: Client) -> Dict[str, float]:
     """Benchmark latency with service profile (PRB estimation)."""
     print("\n" + "="*70)
     print("BENCHMARK 4: Service Profile Overhead")
@@ -188,7 +511,7 @@ def benchmark_service_profile_overhead() -> Dict[str, float]:
         indication = create_indication(f"BENCH-SIMPLE-{i}")
 
         start = time.perf_counter()
-        response = requests.post(INDICATION_ENDPOINT, json=indication)
+        client.post(INDICATION_ENDPOINT, orjson.dumps(indication))
         end = time.perf_counter()
 
         simple_latencies.append((end - start) * 1000)
@@ -208,7 +531,7 @@ def benchmark_service_profile_overhead() -> Dict[str, float]:
         }
 
         start = time.perf_counter()
-        response = requests.post(INDICATION_ENDPOINT, json=indication)
+        client.post(INDICATION_ENDPOINT, orjson.dumps(indication))
         end = time.perf_counter()
 
         profile_latencies.append((end - start) * 1000)
@@ -228,7 +551,7 @@ def benchmark_service_profile_overhead() -> Dict[str, float]:
     }
 
 
-def benchmark_flight_plan_overhead() -> Dict[str, float]:
+def benchmark_flight_plan_overhead(client: Client) -> Dict[str, float]:
     """Benchmark latency with/without flight plan."""
     print("\n" + "="*70)
     print("BENCHMARK 5: Flight Plan Overhead")
@@ -242,7 +565,7 @@ def benchmark_flight_plan_overhead() -> Dict[str, float]:
         indication = create_indication(f"BENCH-NOPLAN-{i}")
 
         start = time.perf_counter()
-        response = requests.post(INDICATION_ENDPOINT, json=indication)
+        client.post(INDICATION_ENDPOINT, orjson.dumps(indication))
         end = time.perf_counter()
 
         no_plan_latencies.append((end - start) * 1000)
@@ -282,7 +605,7 @@ def benchmark_flight_plan_overhead() -> Dict[str, float]:
         }
 
         start = time.perf_counter()
-        response = requests.post(INDICATION_ENDPOINT, json=indication)
+        client.post(INDICATION_ENDPOINT, orjson.dumps(indication))
         end = time.perf_counter()
 
         plan_latencies.append((end - start) * 1000)
@@ -302,35 +625,37 @@ def benchmark_flight_plan_overhead() -> Dict[str, float]:
     }
 
 
-def main():
-    """Run all performance benchmarks."""
+def _run_suite(client: Client, client_name: str) -> bool:
+    """Health-check the server, run every benchmark with ``client``, save results."""
     print("\n" + "#"*70)
     print("# UAV POLICY XAPP - PERFORMANCE BENCHMARK SUITE")
     print("#"*70)
 
     # Check server health
     try:
-        health = requests.get(HEALTH_ENDPOINT, timeout=5).json()
+        health = orjson.loads(client.get(HEALTH_ENDPOINT)[1])
         print(f"\n✓ Server Status: {health['status']}")
     except Exception as e:
         print(f"✗ ERROR: Cannot connect to server: {e}")
         return False
 
-    results = {}
+    results = {"client": client_name}
 
     try:
-        results["latency"] = benchmark_latency(num_requests=100)
-        results["throughput"] = benchmark_throughput(duration_seconds=10)
-        results["concurrent_uavs"] = benchmark_concurrent_uavs(num_uavs=50)
-        results["service_profile"] = benchmark_service_profile_overhead()
-        results["flight_plan"] = benchmark_flight_plan_overhead()
+        results["cold_start"] = benchmark_cold_start(client)
+        results["latency"] = benchmark_latency(client, num_requests=100)
+        results["throughput"] = benchmark_throughput(client, duration_seconds=10)
+        results["concurrent_uavs"] = benchmark_concurrent_uavs(client, num_uavs=50)
+        results["service_profile"] = benchmark_service_profile_overhead(client)
+        results["flight_plan"] = benchmark_flight_plan_overhead(client)
 
         # Summary
         print("\n" + "#"*70)
         print("# BENCHMARK SUMMARY")
         print("#"*70)
 
-        print(f"\nLatency (P50):         {results['latency']['p50']:.2f} ms")
+        print(f"\nCold Start:            {results['cold_start']['first_request_ms']:.2f} ms")
+        print(f"Latency (P50):         {results['latency']['p50']:.2f} ms")
         print(f"Latency (P99):         {results['latency']['p99']:.2f} ms")
         print(f"Throughput (RPS):      {results['throughput']['rps']:.1f} req/sec")
         print(f"Scalability (50 UAVs): {results['concurrent_uavs']['mean_latency_ms']:.2f} ms")
@@ -342,8 +667,8 @@ def main():
         print("#"*70 + "\n")
 
         # Save results
-        with open("benchmark_results.json", "w") as f:
-            json.dump(results, f, indent=2)
+        with open("benchmark_results.json", "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         print("Results saved to benchmark_results.json\n")
 
         return True
@@ -355,6 +680,19 @@ def main():
         return False
 
 
+def main():
+    """Run all performance benchmarks with one client shared by the suite."""
+    parser = argparse.ArgumentParser(description="UAV policy xApp performance benchmarks")
+    parser.add_argument("--client", choices=sorted(CLIENTS), default="requests",
+                        help="HTTP client library used for the benchmarks (default: requests)")
+    args = parser.parse_args()
+    client = CLIENTS[args.client]()
+    try:
+        return _run_suite(client, args.client)
+    finally:
+        client.close()
+
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
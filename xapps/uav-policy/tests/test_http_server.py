@@ -1,18 +1,71 @@
 """Tests for the HTTP server that handles E2 indications."""
 
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import pytest
+from werkzeug.test import EnvironBuilder
+from uav_policy.policy_engine import ResourceDecision
 from uav_policy.server import create_app, PolicyEngineHandler
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the Flask app."""
+@pytest.fixture(scope="module")
+def app():
+    """Create the Flask app once for all tests in this module."""
     app = create_app()
     app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create a test client for the Flask app, with empty decision history."""
+    app.extensions["uav_policy"].reset()
     with app.test_client() as client:
         yield client
 
 
+def _post_json(client, payload, path="/e2/indication", status=200):
+    """POST ``payload`` as orjson bytes; return the orjson-decoded response body.
+
+    Asserts that the response status code is ``status``.
+    """
+    response = client.post(path, data=orjson.dumps(payload), content_type="application/json")
+    assert response.status_code == status
+    return orjson.loads(response.data)
+
+
+def _post_many(app, payloads, path="/e2/indication"):
+    """POST each payload straight to ``app.wsgi_app``, without the test client.
+
+    One environ is built up front and copied per request with a fresh body,
+    for tests that send many indications. Returns ``(status_code, json)``
+    per payload.
+    """
+    builder = EnvironBuilder(path=path, method="POST", content_type="application/json")
+    template = builder.get_environ()
+    statuses = []
+
+    def start_response(status, headers, exc_info=None):
+        statuses.append(int(status.split(" ", 1)[0]))
+
+    results = []
+    for payload in payloads:
+        body = orjson.dumps(payload)
+        environ = dict(template)
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+        chunks = app.wsgi_app(environ, start_response)
+        try:
+            data = orjson.loads(b"".join(chunks))
+        finally:
+            getattr(chunks, "close", lambda: None)()
+        results.append((statuses[-1], data))
+    return results
+
+
 def test_health_check_endpoint(client):
     """Test: GET /health returns 200 OK."""
     response = client.get("/health")
@@ -39,14 +92,7 @@ def test_e2_indication_basic(client):
         },
     }
 
-    response = client.post(
-        "/e2/indication",
-        json=indication_data,
-        headers={"Content-Type": "application/json"}
-    )
-
-    assert response.status_code == 200
-    data = response.get_json()
+    data = _post_json(client, indication_data)
 
     # Verify ResourceDecision fields
     assert data["uav_id"] == "uav-001"
@@ -97,14 +143,7 @@ def test_e2_indication_with_flight_plan(client):
         },
     }
 
-    response = client.post(
-        "/e2/indication",
-        json=indication_data,
-        headers={"Content-Type": "application/json"}
-    )
-
-    assert response.status_code == 200
-    data = response.get_json()
+    data = _post_json(client, indication_data)
     assert data["uav_id"] == "uav-001"
     # When serving is hot and neighbor is stronger, should follow flight plan
     assert data["target_cell_id"] == "cell-B"
@@ -118,17 +157,27 @@ def test_e2_indication_missing_fields(client):
         # Missing position and radio_snapshot
     }
 
-    response = client.post(
-        "/e2/indication",
-        json=indication_data,
-        headers={"Content-Type": "application/json"}
-    )
-
-    assert response.status_code == 400
-    data = response.get_json()
+    data = _post_json(client, indication_data, status=400)
     assert "error" in data
 
 
+def test_e2_indication_non_numeric_field(client):
+    """Test: POST /e2/indication with a non-numeric measurement returns 400."""
+    indication_data = {
+        "uav_id": "uav-001",
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "rsrp_serving": "strong",
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.75,
+        },
+    }
+
+    data = _post_json(client, indication_data, status=400)
+    assert "radio_snapshot.rsrp_serving" in data["error"]
+
+
 def test_e2_indication_invalid_json(client):
     """Test: POST /e2/indication with invalid JSON returns 400."""
     response = client.post(
@@ -140,6 +189,81 @@ def test_e2_indication_invalid_json(client):
     assert response.status_code == 400
 
 
+def test_e2_indication_non_string_uav_id(client):
+    """Test: POST /e2/indication with a non-string uav_id returns 400 and records nothing."""
+    indication_data = {
+        "uav_id": ["uav-001"],
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "rsrp_serving": -88.0,
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.75,
+        },
+    }
+
+    data = _post_json(client, indication_data, status=400)
+    assert "uav_id" in data["error"]
+    assert client.get("/stats").get_json()["total_decisions"] == 0
+
+
+def test_e2_indications_batch(client):
+    """Test: POST /api/v1/e2/indications:batch returns one result per indication."""
+    indication_data = {
+        "uav_id": "uav-001",
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "neighbor_cell_ids": ["cell-B"],
+            "rsrp_serving": -88.0,
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.75,
+        },
+    }
+    batch = {
+        "indications": [
+            indication_data,
+            {"uav_id": "uav-002"},
+            dict(indication_data, uav_id="uav-003"),
+        ]
+    }
+
+    data = _post_json(client, batch, path="/api/v1/e2/indications:batch")
+    assert data["count"] == 3
+    assert [d.get("uav_id") for d in data["decisions"]] == ["uav-001", None, "uav-003"]
+    assert "error" in data["decisions"][1]
+
+    # Only the valid indications are recorded
+    stats = client.get("/stats").get_json()
+    assert stats["total_decisions"] == 2
+    assert stats["uav_list"] == ["uav-001", "uav-003"]
+
+    response = client.post("/api/v1/e2/indications:batch", json=[indication_data])
+    assert response.status_code == 400
+
+
+def test_e2_indications_batch_non_object_items(client):
+    """Test: Non-object batch items become error entries without failing the batch."""
+    indication_data = {
+        "uav_id": "uav-001",
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "neighbor_cell_ids": ["cell-B"],
+            "rsrp_serving": -88.0,
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.75,
+        },
+    }
+    batch = {"indications": [1, None, indication_data, dict(indication_data, uav_id={})]}
+
+    data = _post_json(client, batch, path="/api/v1/e2/indications:batch")
+    assert data["count"] == 4
+    assert [("error" in d) for d in data["decisions"]] == [True, True, False, True]
+    assert data["decisions"][2]["uav_id"] == "uav-001"
+    assert client.get("/stats").get_json()["uav_list"] == ["uav-001"]
+
+
 def test_decisions_endpoint(client):
     """Test: GET /decisions returns list of recent decisions."""
     # First, submit an indication
@@ -158,7 +282,7 @@ def test_decisions_endpoint(client):
         },
     }
 
-    client.post("/e2/indication", json=indication_data)
+    _post_json(client, indication_data)
 
     # Then retrieve decisions
     response = client.get("/decisions")
@@ -169,6 +293,77 @@ def test_decisions_endpoint(client):
     assert len(data["decisions"]) >= 1
 
 
+def test_decisions_endpoint_field_selection(client):
+    """Test: GET /decisions?fields= returns only the requested fields."""
+    indication_data = {
+        "uav_id": "uav-001",
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "neighbor_cell_ids": ["cell-B"],
+            "rsrp_serving": -88.0,
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.75,
+        },
+    }
+    _post_json(client, indication_data)
+
+    response = client.get("/decisions?fields=uav_id,prb_quota")
+    assert response.status_code == 200
+    decisions = response.get_json()["decisions"]
+    assert len(decisions) == 1
+    assert set(decisions[0]) == {"uav_id", "prb_quota"}
+    assert decisions[0]["uav_id"] == "uav-001"
+
+    response = client.get("/decisions?fields=uav_id,bogus")
+    assert response.status_code == 400
+
+
+def test_fast_path_matches_flask_routes(app, client):
+    """Test: /e2/indication and /decisions answer alike on the fast path and Flask routes."""
+    indication_data = {
+        "uav_id": "uav-001",
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "neighbor_cell_ids": ["cell-B"],
+            "rsrp_serving": -88.0,
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.95,
+        },
+    }
+    cases = [
+        ("POST", "/e2/indication", indication_data),
+        ("POST", "/e2/indication", {"uav_id": "uav-001"}),
+        ("POST", "/e2/indication", dict(indication_data, uav_id=7)),
+        ("GET", "/decisions?limit=1", None),
+        ("GET", "/decisions?limit=bogus&fields=uav_id,prb_quota", None),
+        ("GET", "/decisions?fields=uav_id,bogus", None),
+    ]
+
+    def answer(method, path, payload):
+        if method == "POST":
+            response = client.post(
+                path, data=orjson.dumps(payload), content_type="application/json"
+            )
+        else:
+            response = client.get(path)
+        body = orjson.loads(response.data)
+        body.pop("timestamp", None)
+        for record in body.get("decisions", []):
+            record.pop("timestamp", None)
+        return response.status_code, body
+
+    for method, path, payload in cases:
+        fast = answer(method, path, payload)
+        app.debug = True  # Debug mode always goes through the Flask routes
+        try:
+            flask = answer(method, path, payload)
+        finally:
+            app.debug = False
+        assert fast == flask, (method, path)
+
+
 def test_e2_indication_with_service_profile(client):
     """Test: POST /e2/indication respects service profile QoS."""
     indication_data = {
@@ -191,14 +386,7 @@ def test_e2_indication_with_service_profile(client):
         },
     }
 
-    response = client.post(
-        "/e2/indication",
-        json=indication_data,
-        headers={"Content-Type": "application/json"}
-    )
-
-    assert response.status_code == 200
-    data = response.get_json()
+    data = _post_json(client, indication_data)
     # PRB quota should be computed to meet service requirements
     assert data["prb_quota"] is not None
     assert data["prb_quota"] >= 5
@@ -237,6 +425,136 @@ def test_policy_engine_handler_parse_indication():
     assert radio_snapshot.rsrp_best_neighbor == -82.0
 
 
+def test_policy_engine_handler_reuses_parsed_flight_plan():
+    """Test: Identical flight plans are parsed once; changed ones are re-parsed."""
+    plan_json = {
+        "uav_id": "uav-001",
+        "segments": [
+            {
+                "start_pos": 0.0,
+                "end_pos": 1.0,
+                "planned_cell_id": "cell-A",
+                "slice_id": "uav-hd-video",
+                "base_prb_quota": 20,
+            }
+        ],
+    }
+
+    handler = PolicyEngineHandler(parse_cache_size=1)
+    first = handler._cached_parse(handler._plan_cache, handler.parse_flight_plan, plan_json)
+    again = handler._cached_parse(
+        handler._plan_cache, handler.parse_flight_plan, dict(reversed(plan_json.items()))
+    )
+    assert again is first
+
+    changed = dict(plan_json, uav_id="uav-002")
+    other = handler._cached_parse(handler._plan_cache, handler.parse_flight_plan, changed)
+    assert other is not first
+    assert other.uav_id == "uav-002"
+    assert len(handler._plan_cache) == 1
+
+
+def test_policy_engine_handler_reuses_decisions_for_identical_inputs():
+    """Test: Repeated indications reuse the decision; any changed input re-decides."""
+    indication_json = {
+        "uav_id": "uav-001",
+        "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+        "path_position": 0.5,
+        "radio_snapshot": {
+            "serving_cell_id": "cell-A",
+            "neighbor_cell_ids": ["cell-B"],
+            "rsrp_serving": -88.0,
+            "rsrp_best_neighbor": -82.0,
+            "prb_utilization_serving": 0.95,
+        },
+        "service_profile": {
+            "name": "uav-hd-video",
+            "target_bitrate_mbps": 8.0,
+            "min_sinr_db": -3.0,
+        },
+    }
+
+    handler = PolicyEngineHandler()
+    first = handler.handle_indication(indication_json)
+    assert handler.handle_indication(orjson.loads(orjson.dumps(indication_json))) is first
+
+    radio = dict(indication_json["radio_snapshot"], rsrp_best_neighbor=-86.0)
+    changed = handler.handle_indication(dict(indication_json, radio_snapshot=radio))
+    assert changed is not first
+    assert changed.target_cell_id == "cell-A" and first.target_cell_id == "cell-B"
+
+    uncached = PolicyEngineHandler(decision_cache_size=0)
+    assert uncached.handle_indication(indication_json) == first
+    assert not uncached._decision_cache
+
+    # Malformed neighbor ids skip the cache instead of failing the request
+    for neighbor_cell_ids in (None, [["cell-B"]]):
+        radio = dict(indication_json["radio_snapshot"], neighbor_cell_ids=neighbor_cell_ids)
+        handler.handle_indication(dict(indication_json, radio_snapshot=radio))
+    assert len(handler._decision_cache) == 2
+
+
+def test_policy_engine_handler_decision_cache_is_thread_safe():
+    """Test: Concurrent lookups and evictions on tiny decision/parse caches never fail."""
+    handler = PolicyEngineHandler(max_history=0, parse_cache_size=4, decision_cache_size=4)
+    indications = [
+        {
+            "uav_id": f"uav-{i:03d}",
+            "position": {"x": 0.0, "y": 0.0, "z": 100.0},
+            "radio_snapshot": {
+                "serving_cell_id": "cell-A",
+                "neighbor_cell_ids": ["cell-B"],
+                "rsrp_serving": -88.0,
+                "rsrp_best_neighbor": -82.0,
+                "prb_utilization_serving": 0.95,
+            },
+            "service_profile": {"name": f"profile-{i}", "target_bitrate_mbps": 10.0},
+        }
+        for i in range(8)
+    ]
+
+    def work(offset):
+        for n in range(2000):
+            handler.handle_indication(indications[(n + offset) % len(indications)])
+
+    logger = logging.getLogger("uav_policy.server")
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(work, offset) for offset in range(8)]:
+                future.result()
+    finally:
+        logger.setLevel(level)
+    assert len(handler._decision_cache) == 4
+    assert len(handler._profile_cache) == 4
+
+
+def test_policy_engine_handler_decision_log(tmp_path):
+    """Test: Recorded decisions are appended to the JSONL decision log, which rotates."""
+    log_path = tmp_path / "decisions.jsonl"
+    handler = PolicyEngineHandler(max_history=2, decision_log=str(log_path))
+    decisions = [
+        ResourceDecision(f"uav-{i:03d}", "cell-A", None, 10 + i, reason="test")
+        for i in range(3)
+    ]
+    handler.record_decision(decisions[0])
+    handler.record_decisions(decisions[1:])
+    handler.flush_log()
+
+    records = [orjson.loads(line) for line in log_path.read_bytes().splitlines()]
+    assert [r["uav_id"] for r in records] == ["uav-000", "uav-001", "uav-002"]
+    assert records[2]["prb_quota"] == 12
+    # In-memory history keeps only the newest max_history decisions
+    assert handler.get_stats()["uav_list"] == ["uav-001", "uav-002"]
+
+    handler.decision_log_max_bytes = 1
+    handler.record_decision(decisions[0])
+    handler.close()
+    assert len((tmp_path / "decisions.jsonl.1").read_bytes().splitlines()) == 4
+    assert log_path.read_bytes() == b""
+
+
 def test_multiple_uavs_independent_decisions(client):
     """Test: Multiple UAVs get independent decisions."""
     for uav_id in ["uav-001", "uav-002", "uav-003"]:
@@ -255,9 +573,7 @@ def test_multiple_uavs_independent_decisions(client):
             },
         }
 
-        response = client.post("/e2/indication", json=indication_data)
-        assert response.status_code == 200
-        data = response.get_json()
+        data = _post_json(client, indication_data)
         assert data["uav_id"] == uav_id
 
     # Verify all decisions are recorded
@@ -265,3 +581,32 @@ def test_multiple_uavs_independent_decisions(client):
     assert response.status_code == 200
     data = response.get_json()
     assert len(data["decisions"]) >= 3
+
+    # Every request went through the app's single handler
+    handler = client.application.extensions["uav_policy"]
+    assert handler.get_stats()["unique_uavs"] == 3
+
+
+def test_many_uavs_via_direct_wsgi(client):
+    """Test: Hundreds of UAVs posted through the WSGI app each get their decision."""
+    uav_ids = [f"uav-{i:03d}" for i in range(200)]
+    payloads = [
+        {
+            "uav_id": uav_id,
+            "position": {"x": 100.0, "y": 50.0, "z": 120.0},
+            "radio_snapshot": {
+                "serving_cell_id": "cell-A",
+                "neighbor_cell_ids": ["cell-B"],
+                "rsrp_serving": -88.0,
+                "rsrp_best_neighbor": -82.0,
+                "prb_utilization_serving": 0.95 if i % 2 else 0.5,
+            },
+        }
+        for i, uav_id in enumerate(uav_ids)
+    ]
+
+    results = _post_many(client.application, payloads)
+    assert [status for status, _ in results] == [200] * len(uav_ids)
+    assert [data["uav_id"] for _, data in results] == uav_ids
+    assert [data["target_cell_id"] for _, data in results[:2]] == ["cell-A", "cell-B"]
+    assert client.get("/stats").get_json()["unique_uavs"] == len(uav_ids)
@@ -4,6 +4,8 @@ from uav_policy.policy_engine import (
     PathSegmentPlan,
     FlightPlanPolicy,
     ServiceProfile,
+    ReasonFlag,
+    estimate_required_prb,
     simple_path_aware_policy,
     path_aware_rc_policy,
 )
@@ -106,3 +108,37 @@ def test_path_aware_policy_stays_on_serving_when_load_ok():
 
     assert decision.target_cell_id == "cell-A"
     assert decision.prb_quota >= 5
+
+
+def test_path_aware_policy_reason_is_built_from_flags():
+    uav = UavState(uav_id="uav-001", x=0.0, y=0.0, z=100.0, slice_id="slice-eMBB")
+    radio = RadioSnapshot(
+        serving_cell_id="cell-A",
+        neighbor_cell_ids=["cell-B"],
+        rsrp_serving=-90.0,
+        rsrp_best_neighbor=-84.0,
+        prb_utilization_serving=0.95,
+    )
+
+    decision = path_aware_rc_policy(uav, radio)
+
+    assert decision.reason_flags & ReasonFlag.REACTIVE_HANDOVER
+    assert decision.reason_flags & ReasonFlag.SLICE_FROM_UAV
+    assert decision.reason == (
+        "No active flight-plan segment; using reactive policy only. "
+        "Reactive handover: serving overloaded (util=95.0%), neighbor stronger by 6.0 dB. "
+        "Using UAV slice_id=slice-eMBB. "
+        "No ServiceProfile provided; using base quota from flight-plan or default."
+    )
+
+
+def test_service_profile_required_prb_matches_estimate():
+    service = ServiceProfile(name="uav-hd-video", target_bitrate_mbps=8.0, min_sinr_db=-3.0)
+    sinrs = [-20.0, -10.0, -3.5, 0.0, 0.1, 7.25, 30.0, 0.0]
+    assert [service.required_prb(s) for s in sinrs] == [
+        estimate_required_prb(8.0, s) for s in sinrs
+    ]
+    assert len(service._prb_by_sinr) == len(set(sinrs))
+    # The cache is not part of the profile's value
+    assert service == ServiceProfile("uav-hd-video", 8.0, -3.0)
+    assert hash(service) == hash(ServiceProfile("uav-hd-video", 8.0, -3.0))
@@ -0,0 +1,148 @@
+from uav_policy.policy_engine import (
+    UavState,
+    RadioSnapshot,
+    PathSegmentPlan,
+    FlightPlanPolicy,
+    ServiceProfile,
+    find_active_segment,
+    path_aware_rc_policy,
+    simple_path_aware_policy,
+)
+from uav_policy.policy_engine_fast import (
+    TARGET_SERVING,
+    TARGET_PLANNED,
+    TARGET_NEIGHBOR,
+    RadioSnapshotBatch,
+    decide_batch,
+    find_active_segment_indices,
+    path_aware_rc_policy_batch,
+    simple_path_aware_policy_batch,
+)
+
+
+def test_decide_batch_matches_scalar_policy():
+    service = ServiceProfile(name="uav-hd-video", target_bitrate_mbps=8.0, min_sinr_db=-3.0)
+    segment = PathSegmentPlan(
+        start_pos=0.0,
+        end_pos=1.0,
+        planned_cell_id="cell-B",
+        slice_id="uav-hd-video",
+        base_prb_quota=20,
+    )
+    plan = FlightPlanPolicy(uav_id="uav-001", segments=[segment])
+    cases = [
+        # (radio, plan, service, expected target code)
+        (RadioSnapshot("cell-A", ["cell-B"], -90.0, -84.0, 0.95), plan, service, TARGET_PLANNED),
+        (RadioSnapshot("cell-A", ["cell-B"], -90.0, -84.0, 0.50), plan, None, TARGET_SERVING),
+        (RadioSnapshot("cell-A", ["cell-C"], 2.0, 9.0, 0.90), None, service, TARGET_NEIGHBOR),
+        (RadioSnapshot("cell-A", [], 2.0, 9.0, 0.90), None, None, TARGET_SERVING),
+    ]
+
+    target, prb_quota = decide_batch(
+        prb_util=[r.prb_utilization_serving for r, _, _, _ in cases],
+        rsrp_serving=[r.rsrp_serving for r, _, _, _ in cases],
+        rsrp_neighbor=[r.rsrp_best_neighbor for r, _, _, _ in cases],
+        has_neighbor=[bool(r.neighbor_cell_ids) for r, _, _, _ in cases],
+        has_segment=[p is not None for _, p, _, _ in cases],
+        plan_differs=[p is not None and r.serving_cell_id != "cell-B" for r, p, _, _ in cases],
+        neighbor_is_serving=[False] * len(cases),
+        seg_quota=[20 if p is not None else 0 for _, p, _, _ in cases],
+        has_service=[s is not None for _, _, s, _ in cases],
+        target_bitrate_mbps=[s.target_bitrate_mbps if s else 0.0 for _, _, s, _ in cases],
+    )
+
+    assert target.tolist() == [code for _, _, _, code in cases]
+    for (radio, p, s, _), quota in zip(cases, prb_quota.tolist()):
+        uav = UavState(uav_id="uav-001", x=0.0, y=0.0, z=100.0, path_position=0.5)
+        assert quota == path_aware_rc_policy(uav, radio, plan=p, service=s).prb_quota
+
+
+def test_path_aware_rc_policy_batch_matches_scalar_decisions():
+    plan = FlightPlanPolicy(
+        uav_id="uav-001",
+        segments=[
+            PathSegmentPlan(0.0, 0.5, "cell-A", "uav-hd-video", 20),
+            PathSegmentPlan(0.5, 1.0, "cell-B", "uav-hd-video", 30),
+        ],
+    )
+    service = ServiceProfile(name="uav-hd-video", target_bitrate_mbps=8.0, min_sinr_db=-3.0)
+    uavs = [
+        UavState(uav_id="uav-001", x=0.0, y=0.0, z=100.0, path_position=0.7),
+        UavState(uav_id="uav-002", x=0.0, y=0.0, z=100.0, slice_id="slice-eMBB"),
+        UavState(uav_id="uav-003", x=0.0, y=0.0, z=100.0, path_position=0.2),
+    ]
+    radios = [
+        RadioSnapshot("cell-A", ["cell-B"], -90.0, -84.0, 0.95),
+        RadioSnapshot("cell-A", ["cell-C"], 2.0, 9.0, 0.90),
+        RadioSnapshot("cell-A", ["cell-B"], -90.0, -84.0, 0.95),
+    ]
+    plans = [plan, None, plan]
+    services = [service, None, service]
+
+    batch = path_aware_rc_policy_batch(
+        uavs, RadioSnapshotBatch.from_snapshots(radios), plans, services
+    )
+    assert batch.target_cell_id == ["cell-B", "cell-C", "cell-A"]
+
+    for uav, radio, p, s, decision in zip(uavs, radios, plans, services, batch.to_decisions()):
+        expected = path_aware_rc_policy(uav, radio, plan=p, service=s)
+        assert decision.target_cell_id == expected.target_cell_id
+        assert decision.slice_id == expected.slice_id
+        assert decision.prb_quota == expected.prb_quota
+
+
+def test_simple_path_aware_policy_batch_matches_scalar_decisions():
+    uavs = [
+        UavState(uav_id=f"uav-{i:03d}", x=0.0, y=0.0, z=100.0, slice_id="slice-eMBB")
+        for i in range(4)
+    ]
+    radios = [
+        RadioSnapshot("cell-A", ["cell-B"], -90.0, -84.0, 0.95),
+        RadioSnapshot("cell-A", ["cell-B"], -90.0, -84.0, 0.50),
+        RadioSnapshot("cell-A", ["cell-C"], -90.0, -87.0, 0.95),
+        RadioSnapshot("cell-A", [], -90.0, -80.0, 0.95),
+    ]
+
+    batch = simple_path_aware_policy_batch(uavs, RadioSnapshotBatch.from_snapshots(radios))
+    assert batch.target.tolist() == [
+        TARGET_NEIGHBOR,
+        TARGET_SERVING,
+        TARGET_SERVING,
+        TARGET_SERVING,
+    ]
+    assert batch.to_decisions() == [
+        simple_path_aware_policy(uav, radio) for uav, radio in zip(uavs, radios)
+    ]
+
+
+def test_find_active_segment_indices_matches_scalar_lookup():
+    plan = FlightPlanPolicy(
+        uav_id="uav-001",
+        segments=[
+            PathSegmentPlan(0.0, 0.25, "cell-A", "uav-hd-video", 20),
+            PathSegmentPlan(0.25, 0.6, "cell-B", "uav-hd-video", 20),
+            PathSegmentPlan(0.7, 1.0, "cell-C", "uav-hd-video", 20),
+        ],
+    )
+    positions = [-0.1, 0.0, 0.1, 0.25, 0.59, 0.65, 0.7, 0.99, 1.0, 1.5]
+
+    indices = find_active_segment_indices(plan, positions).tolist()
+    assert [plan.segments[i] for i in indices] == [
+        find_active_segment(plan, pos) for pos in positions
+    ]
+    assert find_active_segment_indices(FlightPlanPolicy("uav-002", []), [0.5]).tolist() == [-1]
+
+    # Out-of-order (but non-overlapping) segments are still binary-searched
+    shuffled = FlightPlanPolicy("uav-001", [plan.segments[2], plan.segments[0], plan.segments[1]])
+    assert shuffled._bisectable
+    indices = find_active_segment_indices(shuffled, positions).tolist()
+    first_match = [
+        next((seg for seg in shuffled.segments if seg.start_pos <= pos < seg.end_pos), None)
+        for pos in positions
+    ]
+    assert [shuffled.segments[i] for i in indices] == [
+        seg if seg is not None else shuffled.segments[-1] for seg in first_match
+    ]
+    assert [find_active_segment(shuffled, pos) for pos in positions] == [
+        shuffled.segments[i] for i in indices
+    ]